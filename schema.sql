@@ -52,6 +52,7 @@ CREATE INDEX idx_team_name ON player_game_stats (team_name);
 CREATE INDEX ix_player_game_stats_season ON player_game_stats (season);
 CREATE INDEX idx_game_date ON player_game_stats (game_date);
 CREATE INDEX idx_team ON player_game_stats (team_abbrev);
+CREATE INDEX idx_season_date_player ON player_game_stats (season, game_date, player_id);
 CREATE TABLE goalie_game_stats (
 	game_id INTEGER NOT NULL, 
 	player_id INTEGER NOT NULL, 
@@ -81,6 +82,7 @@ CREATE INDEX ix_goalie_game_stats_position ON goalie_game_stats (position);
 CREATE INDEX ix_goalie_game_stats_season ON goalie_game_stats (season);
 CREATE INDEX idx_goalie_team ON goalie_game_stats (team_abbrev);
 CREATE INDEX idx_goalie_player_date ON goalie_game_stats (player_id, game_date);
+CREATE INDEX idx_goalie_season_date_player ON goalie_game_stats (season, game_date, player_id);
 CREATE TABLE pro_players (
 	player_id INTEGER NOT NULL, 
 	espn_id INTEGER, 
@@ -113,3 +115,4 @@ CREATE INDEX ix_pro_players_player_name ON pro_players (player_name);
 CREATE INDEX ix_pro_players_team_abbrev ON pro_players (team_abbrev);
 CREATE UNIQUE INDEX ix_pro_players_espn_id ON pro_players (espn_id);
 CREATE INDEX ix_pro_players_position ON pro_players (position);
+CREATE INDEX ix_pro_players_fantasy_team_id ON pro_players (fantasy_team_id);
@@ -6,6 +6,7 @@ from src.core.constants import FANTASY_TIMEZONE, NHL_TEAMS
 
 # --- Import the new logic function ---
 from src.utils.date_utils import calculate_remaining_week_matchups
+from src.utils.http_client import run_and_close_client
 import asyncio
 
 
@@ -44,4 +45,4 @@ async def print_remaining_matchups():
 
 
 if __name__ == "__main__":
-    asyncio.run(print_remaining_matchups())
+    asyncio.run(run_and_close_client(print_remaining_matchups()))
@@ -1,5 +1,6 @@
 import argparse
 import sys
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select, func
 from src.core import constants
 from src.database.utils import clear_table, find_player_interactive
@@ -7,6 +8,15 @@ from src.database.database import engine
 from src.database.models import FantasyTeam, ProPlayers
 from typing import List
 
+# Roster listings only show these fields, so skip loading the season stat columns
+ROSTER_VIEW_COLUMNS = load_only(
+    ProPlayers.player_id,
+    ProPlayers.player_name,
+    ProPlayers.position,
+    ProPlayers.team_abbrev,
+    ProPlayers.fantasy_team_id,
+)
+
 
 def force_refresh(auto_confirm=False, session: Session = None):
     """
@@ -26,7 +36,11 @@ def force_refresh(auto_confirm=False, session: Session = None):
     if res == "y" or auto_confirm:
         clear_table(session, FantasyTeam)
         # Also need to clear the fantasy_team_id from all players
-        statement = select(ProPlayers).where(ProPlayers.fantasy_team_id is not None)
+        statement = (
+            select(ProPlayers)
+            .where(ProPlayers.fantasy_team_id.is_not(None))
+            .options(ROSTER_VIEW_COLUMNS)
+        )
         players_to_clear = session.exec(statement).all()
 
         if players_to_clear:
@@ -176,6 +190,7 @@ def select_players_from_roster(session: Session, team: FantasyTeam) -> List[ProP
         select(ProPlayers)
         .where(ProPlayers.fantasy_team_id == team.team_id)
         .order_by(ProPlayers.player_name)
+        .options(ROSTER_VIEW_COLUMNS)
     ).all()
 
     if not roster:
@@ -318,6 +333,7 @@ def drop_player_interactive(session: Session, team: FantasyTeam):
         select(ProPlayers)
         .where(ProPlayers.fantasy_team_id == team.team_id)
         .order_by(ProPlayers.player_name)
+        .options(ROSTER_VIEW_COLUMNS)
     ).all()
 
     if not roster:
@@ -409,6 +425,7 @@ def edit_team_menu(session: Session, team: FantasyTeam):
                 select(ProPlayers)
                 .where(ProPlayers.fantasy_team_id == team.team_id)
                 .order_by(ProPlayers.player_name)
+                .options(ROSTER_VIEW_COLUMNS)
             ).all()
             if not roster:
                 print("  This team has no players.")
@@ -0,0 +1,87 @@
+"""
+recompute_fantasy_points.py
+
+Recomputes total_fpts for every stored game of the current season from
+the stat columns already in the DB, using the weights in constants.
+Run this after changing SKATER_FPTS_WEIGHTS / GOALIE_FPTS_WEIGHTS instead
+of re-fetching the whole season from the NHL API.
+"""
+
+import time
+from sqlmodel import Session, text
+from src.core.constants import GOALIE_FPTS_WEIGHTS, SEASON_ID, SKATER_FPTS_WEIGHTS
+from src.database.database import configure_bulk_pragmas, engine
+from scripts.seed_pro_players import populate_pro_players
+
+
+# --- SQL Query Templates ---
+
+# Same terms, in the same order, as calculate_fantasy_points_skater/_goalie,
+# so the rounded totals match what the stats processor writes.
+QUERY_RECOMPUTE_SKATER_FPTS = text(
+    """
+    UPDATE player_game_stats
+    SET total_fpts = ROUND(
+        goals * :goals
+        + assists * :assists
+        + pp_points * :ppPoints
+        + sh_points * :shPoints
+        + shots * :shots
+        + blocked_shots * :blockedShots
+        + hits * :hits,
+        2
+    )
+    WHERE season = :season
+    """
+)
+
+QUERY_RECOMPUTE_GOALIE_FPTS = text(
+    """
+    UPDATE goalie_game_stats
+    SET total_fpts = ROUND(
+        wins * :wins
+        + goals_against * :goalsAgainst
+        + saves * :saves
+        + shutouts * :shutouts
+        + ot_losses * :otLosses,
+        2
+    )
+    WHERE season = :season
+    """
+)
+
+
+def recompute_fantasy_points(session: Session, season: str = SEASON_ID):
+    """
+    Rewrites total_fpts for one season's skater and goalie games in two
+    set-based UPDATEs. Commits the session.
+    """
+    print(f"Recomputing fantasy points for season {season}...")
+
+    skater_count = session.exec(
+        QUERY_RECOMPUTE_SKATER_FPTS.bindparams(season=season, **SKATER_FPTS_WEIGHTS)
+    ).rowcount
+
+    goalie_count = session.exec(
+        QUERY_RECOMPUTE_GOALIE_FPTS.bindparams(season=season, **GOALIE_FPTS_WEIGHTS)
+    ).rowcount
+
+    session.commit()
+    print(f"  - Updated {skater_count} skater and {goalie_count} goalie games.")
+
+
+def main():
+    start_time = time.perf_counter()
+
+    with Session(engine) as session:
+        recompute_fantasy_points(session)
+
+    # Season fantasy point totals are sums of total_fpts, so rebuild them too
+    populate_pro_players()
+
+    print(f"\nDone in {time.perf_counter() - start_time:.2f}s")
+
+
+if __name__ == "__main__":
+    configure_bulk_pragmas()
+    main()
@@ -12,13 +12,14 @@ import time
 from src.core.constants import FANTASY_TIMEZONE, DATABASE_FILE, SEASON_ID
 import pytz
 from datetime import datetime
-from src.database.database import init_db
+from src.database.database import configure_bulk_pragmas, init_db
 
 # --- 1. IMPORT THE CLASS, NOT THE FUNCTION ---
 from src.api.player_stats_fetcher import (
     PlayerStatsProcessor,
 )
 from src.api.nhl_api_utils import get_schedule  # Import the schedule fetcher
+from src.utils.http_client import run_and_close_client
 
 # --- 2. IMPORT THE REBUILD FUNCTION ---
 from scripts.seed_pro_players import populate_pro_players
@@ -33,6 +34,7 @@ async def main():
 
     # Initialize database
     init_db()
+    configure_bulk_pragmas()
 
     print("--- Seeding all past game data ---")
 
@@ -42,6 +44,14 @@ async def main():
     today_local_date = datetime.now(tz).date()
     print(f"Today's date ({FANTASY_TIMEZONE}): {today_local_date}")
 
+    # A game is in the past iff it started before local midnight today.
+    # Convert that instant to a UTC ISO string once; the schedule's fixed-width
+    # UTC strings can then be compared to it directly.
+    local_midnight = tz.localize(
+        datetime.combine(today_local_date, datetime.min.time())
+    )
+    cutoff_utc_iso = local_midnight.astimezone(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     # --- Get all game IDs for the season ---
     print("Fetching full season schedule to get all game IDs...")
     # We force_refresh=True here to ensure we get *all* games
@@ -60,15 +70,11 @@ async def main():
     for game_id_str, game_data in schedule_by_id.items():
         try:
             # game_data["date"] is a UTC string like "2025-11-09T00:00:00Z"
-            game_utc_time = datetime.fromisoformat(
-                game_data["date"].replace("Z", "+00:00")
-            )
-            # Convert game time to the fantasy timezone to get its "local" date
-            game_local_date = game_utc_time.astimezone(tz).date()
+            game_date_str = game_data["date"]
 
-            if game_local_date < today_local_date:
-                # Store as a tuple (date, game_id)
-                past_games_to_sort.append((game_local_date, int(game_id_str)))
+            if game_date_str < cutoff_utc_iso:
+                # Store as a tuple (UTC start time, game_id); ISO strings sort chronologically
+                past_games_to_sort.append((game_date_str, int(game_id_str)))
             else:
                 future_game_count += 1
         except Exception as e:
@@ -91,6 +97,7 @@ async def main():
 
     # Call the core processor with the *filtered and sorted* list
     # use_cache=False to force re-fetch and re-build the cache
+    touched_player_ids = None
     if past_game_ids:
         # --- 3. PASS perform_incremental_update=False ---
         # Create an instance with cache disabled and incremental updates OFF
@@ -99,15 +106,16 @@ async def main():
         )
         # Call the process_games method on the instance
         await processor.process_games(game_ids_to_process=past_game_ids)
+        touched_player_ids = processor.touched_players
     else:
         print("No past games found to process. Exiting.")
 
-    # --- 4. RUN THE FULL REBUILD ---
-    # Now that all stats are in the DB, run the full rebuild
+    # --- 4. RUN THE REBUILD ---
+    # Now that all stats are in the DB, rebuild the players we just wrote
     # to get correct, non-duplicated season totals.
     print("\n" + "=" * 50)
-    print("Running full ProPlayers table rebuild...")
-    populate_pro_players()
+    print("Running ProPlayers table rebuild...")
+    populate_pro_players(touched_player_ids)
     print("ProPlayers table rebuild complete.")
 
     # --- Done ---
@@ -125,4 +133,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close_client(main()))
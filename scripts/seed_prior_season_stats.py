@@ -9,73 +9,82 @@ before the current season starts.
 """
 
 import asyncio
+import math
 import time
+from itertools import batched
 from sqlmodel import Session, text
-from src.database.database import engine, init_db
-from src.database.models import ProPlayers
+from src.database.database import configure_bulk_pragmas, engine, init_db
 from src.api.player_stats_fetcher import PlayerStatsProcessor
 from src.api.nhl_api_utils import get_schedule_for_season
+from src.utils.http_client import run_and_close_client
 
 # Hardcoded prior season ID
 PRIOR_SEASON_ID = "20242025"
 
+# How many game batches are fetched/processed at the same time.
+# Each batch already runs up to CONCURRENCY_LIMIT requests, so keep this low.
+BATCH_CONCURRENCY = 4
 
-def calculate_prior_season_averages(session: Session):
-    """
-    Scans the game stats tables for the PRIOR season and updates
-    the ProPlayers table with averages.
-    """
-    print(f"\nCalculating averages for season {PRIOR_SEASON_ID}...")
-
-    skater_count = 0
-    goalie_count = 0
 
-    # --- Optimized Approach ---
-    # Calculate all averages in one go using SQL
+# --- SQL Query Templates ---
 
-    # Skater Averages
-    sql_skaters = text(
-        f"""
-        SELECT 
-            player_id, 
-            COUNT(game_id) as games_played, 
+# Aggregate each player's prior-season games and write them back in one
+# set-based UPDATE ... FROM per table (no player rows loaded into Python).
+QUERY_UPDATE_SKATER_PRIOR_AVERAGES = text(
+    """
+    UPDATE pro_players
+    SET
+        prior_season_games_played = s.games_played,
+        prior_season_avg_fpts = s.avg_fpts
+    FROM (
+        SELECT
+            player_id,
+            COUNT(game_id) as games_played,
             AVG(total_fpts) as avg_fpts
-        FROM player_game_stats 
-        WHERE season = '{PRIOR_SEASON_ID}'
+        FROM player_game_stats
+        WHERE season = :season
         GROUP BY player_id
+    ) AS s
+    WHERE pro_players.player_id = s.player_id
     """
-    )
-    results_skaters = session.exec(sql_skaters).all()
-
-    for row in results_skaters:
-        player = session.get(ProPlayers, row.player_id)
-        if player:
-            player.prior_season_games_played = row.games_played
-            player.prior_season_avg_fpts = row.avg_fpts
-            session.add(player)
-            skater_count += 1
+)
 
-    # Goalie Averages
-    sql_goalies = text(
-        f"""
-        SELECT 
-            player_id, 
-            COUNT(game_id) as games_played, 
+QUERY_UPDATE_GOALIE_PRIOR_AVERAGES = text(
+    """
+    UPDATE pro_players
+    SET
+        prior_season_games_played = g.games_played,
+        prior_season_avg_fpts = g.avg_fpts
+    FROM (
+        SELECT
+            player_id,
+            COUNT(game_id) as games_played,
             AVG(total_fpts) as avg_fpts
-        FROM goalie_game_stats 
-        WHERE season = '{PRIOR_SEASON_ID}'
+        FROM goalie_game_stats
+        WHERE season = :season
         GROUP BY player_id
+    ) AS g
+    WHERE pro_players.player_id = g.player_id
     """
-    )
-    results_goalies = session.exec(sql_goalies).all()
+)
 
-    for row in results_goalies:
-        player = session.get(ProPlayers, row.player_id)
-        if player:
-            player.prior_season_games_played = row.games_played
-            player.prior_season_avg_fpts = row.avg_fpts
-            session.add(player)
-            goalie_count += 1
+
+def calculate_prior_season_averages(session: Session):
+    """
+    Scans the game stats tables for the PRIOR season and updates
+    the ProPlayers table with averages.
+    """
+    print(f"\nCalculating averages for season {PRIOR_SEASON_ID}...")
+
+    # Skater Averages
+    skater_count = session.exec(
+        QUERY_UPDATE_SKATER_PRIOR_AVERAGES.bindparams(season=PRIOR_SEASON_ID)
+    ).rowcount
+
+    # Goalie Averages
+    goalie_count = session.exec(
+        QUERY_UPDATE_GOALIE_PRIOR_AVERAGES.bindparams(season=PRIOR_SEASON_ID)
+    ).rowcount
 
     session.commit()
     print(
@@ -86,6 +95,7 @@ def calculate_prior_season_averages(session: Session):
 async def main():
     start_time = time.perf_counter()
     init_db()
+    configure_bulk_pragmas()
 
     print("=" * 60)
     print(f"SEEDING PRIOR SEASON STATS ({PRIOR_SEASON_ID})")
@@ -126,21 +136,32 @@ async def main():
     constants.GAME_STATS_CACHE = f"data/game_stats_cache_{PRIOR_SEASON_ID}.json"
 
     try:
-        # Process in chunks to avoid memory issues/timeouts
+        # Process in chunks to avoid memory issues/timeouts.
+        # A few chunks run concurrently so the event loop isn't idle while
+        # one batch waits on the API or writes to the DB.
         chunk_size = 100
-        total_batches = (len(all_game_ids) // chunk_size) + 1
-
-        for i in range(0, len(all_game_ids), chunk_size):
-            chunk = all_game_ids[i : i + chunk_size]
-            print(f"  Processing batch {i // chunk_size + 1}/{total_batches}...")
-
-            # --- OPTIMIZATION: New processor instance per batch ---
-            # This ensures we only hold 100 games in memory at a time
-            # and don't re-write the previous 100 games to DB.
-            processor = PlayerStatsProcessor(
-                use_cache=True, perform_incremental_update=False
-            )
-            await processor.process_games(chunk)
+        total_batches = math.ceil(len(all_game_ids) / chunk_size)
+        batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def run_batch(batch_number: int, chunk: list[int]):
+            async with batch_semaphore:
+                print(f"  Processing batch {batch_number}/{total_batches}...")
+
+                # --- OPTIMIZATION: New processor instance per batch ---
+                # This ensures we only hold 100 games in memory per batch
+                # and don't re-write the previous 100 games to DB.
+                # Batches run side by side, so split the API rate between them
+                processor = PlayerStatsProcessor(
+                    use_cache=True,
+                    perform_incremental_update=False,
+                    max_rate=constants.API_MAX_RATE / BATCH_CONCURRENCY,
+                )
+                await processor.process_games(chunk)
+
+        # A failing batch cancels its siblings instead of leaving them running
+        async with asyncio.TaskGroup() as tg:
+            for batch_number, chunk in enumerate(batched(all_game_ids, chunk_size), 1):
+                tg.create_task(run_batch(batch_number, list(chunk)))
 
     finally:
         # Restore constants just in case (though script exit will reset them)
@@ -156,4 +177,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close_client(main()))
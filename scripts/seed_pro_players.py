@@ -7,217 +7,229 @@ entries in the pro_players table with the most recent information.
 This creates a master list of all NHL players in your database.
 """
 
-from sqlmodel import Session, select, func
-from src.database.database import engine
+from sqlalchemy import bindparam
+from sqlmodel import Session, select, func, text
+from src.database.database import configure_bulk_pragmas, engine
 from src.database.models import ProPlayers, PlayerGameStats, GoalieGameStats
 from src.core.constants import SEASON_ID
-from typing import Dict
+from typing import Dict, Optional
 
 
-def get_latest_skater_info(session: Session) -> Dict[int, dict]:
+def get_latest_player_info(
+    session: Session, player_ids: Optional[set[int]] = None
+) -> Dict[int, dict]:
     """
-    Gets the most recent game info for each skater.
-    Returns dict: {player_id: {player_name, team_abbrev, position, jersey_number}}
+    Gets the most recent game info for each skater and goalie in one query.
+    If player_ids is given, only those players are looked up.
+    Returns dict: {player_id: {player_name, team_abbrev, position, jersey_number, is_goalie}}
     """
-    print("Collecting skater information...")
-
-    # Subquery to get the latest game date for each player
-    latest_game_subquery = (
-        select(
-            PlayerGameStats.player_id,
-            func.max(PlayerGameStats.game_date).label("latest_date"),
+    print("Collecting player information...")
+
+    player_filter = "AND player_id IN :player_ids" if player_ids is not None else ""
+
+    # Rank each player's games newest-first and keep rank 1 from both tables
+    statement = text(
+        f"""
+        WITH skaters AS (
+            SELECT
+                player_id, player_name, team_abbrev, position, jersey_number,
+                ROW_NUMBER() OVER (
+                    PARTITION BY player_id ORDER BY game_date DESC, game_id DESC
+                ) AS rn
+            FROM player_game_stats
+            WHERE season = :season {player_filter}
+        ),
+        goalies AS (
+            SELECT
+                player_id, player_name, team_abbrev, jersey_number,
+                ROW_NUMBER() OVER (
+                    PARTITION BY player_id ORDER BY game_date DESC, game_id DESC
+                ) AS rn
+            FROM goalie_game_stats
+            WHERE season = :season {player_filter}
         )
-        .where(PlayerGameStats.season == SEASON_ID)
-        .group_by(PlayerGameStats.player_id)
-        .subquery()
+        SELECT player_id, player_name, team_abbrev, position, jersey_number,
+               0 AS is_goalie
+        FROM skaters WHERE rn = 1
+        UNION ALL
+        SELECT player_id, player_name, team_abbrev, 'Goalie' AS position,
+               jersey_number, 1 AS is_goalie
+        FROM goalies WHERE rn = 1
+        ORDER BY is_goalie
+        """
     )
-
-    # Get the full record for each player's latest game
-    statement = (
-        select(PlayerGameStats)
-        .join(
-            latest_game_subquery,
-            (PlayerGameStats.player_id == latest_game_subquery.c.player_id)
-            & (PlayerGameStats.game_date == latest_game_subquery.c.latest_date),
-        )
-        .where(PlayerGameStats.season == SEASON_ID)
-    )
-
-    results = session.exec(statement).all()
-
+    params: Dict[str, object] = {"season": SEASON_ID}
+    if player_ids is not None:
+        statement = statement.bindparams(bindparam("player_ids", expanding=True))
+        params["player_ids"] = list(player_ids)
+    results = session.exec(statement, params=params).all()
+
+    # ORDER BY is_goalie puts skater rows first, so a goalie row overwrites
+    # a skater row if a player_id appears in both tables
     player_info = {}
-    for stat in results:
-        player_info[stat.player_id] = {
-            "player_name": stat.player_name,
-            "team_abbrev": stat.team_abbrev,
-            "position": stat.position,
-            "jersey_number": stat.jersey_number,
-            "is_goalie": False,
+    for row in results:
+        player_info[row.player_id] = {
+            "player_name": row.player_name,
+            "team_abbrev": row.team_abbrev,
+            "position": row.position,
+            "jersey_number": row.jersey_number,
+            "is_goalie": bool(row.is_goalie),
         }
 
-    print(f"  Found {len(player_info)} unique skaters")
+    goalie_count = sum(1 for info in player_info.values() if info["is_goalie"])
+    print(f"  Found {len(player_info) - goalie_count} unique skaters")
+    print(f"  Found {goalie_count} unique goalies")
     return player_info
 
 
-def get_latest_goalie_info(session: Session) -> Dict[int, dict]:
+def _season_sum(column, label: str):
+    """SUM() that yields 0 instead of NULL when a player has no games."""
+    return func.coalesce(func.sum(column), 0).label(label)
+
+
+# Season-total aggregates shared by the skater and goalie GROUP BY queries
+SKATER_TOTAL_COLUMNS = (
+    func.count(PlayerGameStats.game_id).label("season_games_played"),
+    _season_sum(PlayerGameStats.total_fpts, "season_total_fpts"),
+    _season_sum(PlayerGameStats.goals, "season_goals"),
+    _season_sum(PlayerGameStats.assists, "season_assists"),
+    _season_sum(PlayerGameStats.pp_points, "season_pp_points"),
+    _season_sum(PlayerGameStats.sh_points, "season_sh_points"),
+    _season_sum(PlayerGameStats.shots, "season_shots"),
+    _season_sum(PlayerGameStats.blocked_shots, "season_blocked_shots"),
+    _season_sum(PlayerGameStats.hits, "season_hits"),
+)
+
+GOALIE_TOTAL_COLUMNS = (
+    func.count(GoalieGameStats.game_id).label("season_games_played"),
+    _season_sum(GoalieGameStats.total_fpts, "season_total_fpts"),
+    _season_sum(GoalieGameStats.wins, "season_wins"),
+    _season_sum(GoalieGameStats.shutouts, "season_shutouts"),
+    _season_sum(GoalieGameStats.ot_losses, "season_ot_losses"),
+    _season_sum(GoalieGameStats.saves, "season_saves"),
+    _season_sum(GoalieGameStats.goals_against, "season_goals_against"),
+)
+
+
+def get_skater_season_totals(
+    session: Session, player_ids: Optional[set[int]] = None
+) -> Dict[int, dict]:
     """
-    Gets the most recent game info for each goalie.
-    Returns dict: {player_id: {player_name, team_abbrev, position, jersey_number}}
+    Aggregates season totals for every skater (or only player_ids) in a
+    single GROUP BY query.
+    Returns dict: {player_id: {season_games_played, season_total_fpts, ...}}
     """
-    print("Collecting goalie information...")
-
-    # Subquery to get the latest game date for each goalie
-    latest_game_subquery = (
-        select(
-            GoalieGameStats.player_id,
-            func.max(GoalieGameStats.game_date).label("latest_date"),
-        )
-        .where(GoalieGameStats.season == SEASON_ID)
-        .group_by(GoalieGameStats.player_id)
-        .subquery()
-    )
-
-    # Get the full record for each goalie's latest game
     statement = (
-        select(GoalieGameStats)
-        .join(
-            latest_game_subquery,
-            (GoalieGameStats.player_id == latest_game_subquery.c.player_id)
-            & (GoalieGameStats.game_date == latest_game_subquery.c.latest_date),
-        )
-        .where(GoalieGameStats.season == SEASON_ID)
+        select(PlayerGameStats.player_id, *SKATER_TOTAL_COLUMNS)
+        .where(PlayerGameStats.season == SEASON_ID)
+        .group_by(PlayerGameStats.player_id)
     )
+    if player_ids is not None:
+        statement = statement.where(PlayerGameStats.player_id.in_(player_ids))
 
-    results = session.exec(statement).all()
-
-    goalie_info = {}
-    for stat in results:
-        goalie_info[stat.player_id] = {
-            "player_name": stat.player_name,
-            "team_abbrev": stat.team_abbrev,
-            "position": "Goalie",
-            "jersey_number": stat.jersey_number,
-            "is_goalie": True,
+    totals = {}
+    for row in session.exec(statement).all():
+        totals[row.player_id] = {
+            key: value for key, value in row._mapping.items() if key != "player_id"
         }
+    return totals
 
-    print(f"  Found {len(goalie_info)} unique goalies")
-    return goalie_info
 
-
-def calculate_season_totals(session: Session, player_id: int, is_goalie: bool) -> dict:
+def get_goalie_season_totals(
+    session: Session, player_ids: Optional[set[int]] = None
+) -> Dict[int, dict]:
     """
-    Calculate accumulated season stats for a player.
+    Aggregates season totals for every goalie (or only player_ids) in a
+    single GROUP BY query.
+    Returns dict: {player_id: {season_games_played, season_total_fpts, ...}}
     """
-    if is_goalie:
-        statement = select(GoalieGameStats).where(
-            GoalieGameStats.player_id == player_id, GoalieGameStats.season == SEASON_ID
-        )
-        games = session.exec(statement).all()
-
-        return {
-            "season_games_played": len(games),
-            "season_total_fpts": sum(g.total_fpts for g in games),
-            "season_wins": sum(g.wins for g in games),
-            "season_shutouts": sum(g.shutouts for g in games),
-            "season_ot_losses": sum(g.ot_losses for g in games),
-            "season_saves": sum(g.saves for g in games),
-            "season_goals_against": sum(g.goals_against for g in games),
-        }
-    else:
-        statement = select(PlayerGameStats).where(
-            PlayerGameStats.player_id == player_id, PlayerGameStats.season == SEASON_ID
-        )
-        games = session.exec(statement).all()
-
-        return {
-            "season_games_played": len(games),
-            "season_total_fpts": sum(g.total_fpts for g in games),
-            "season_goals": sum(g.goals for g in games),
-            "season_assists": sum(g.assists for g in games),
-            "season_pp_points": sum(g.pp_points for g in games),
-            "season_sh_points": sum(g.sh_points for g in games),
-            "season_shots": sum(g.shots for g in games),
-            "season_blocked_shots": sum(g.blocked_shots for g in games),
-            "season_hits": sum(g.hits for g in games),
+    statement = (
+        select(GoalieGameStats.player_id, *GOALIE_TOTAL_COLUMNS)
+        .where(GoalieGameStats.season == SEASON_ID)
+        .group_by(GoalieGameStats.player_id)
+    )
+    if player_ids is not None:
+        statement = statement.where(GoalieGameStats.player_id.in_(player_ids))
+
+    totals = {}
+    for row in session.exec(statement).all():
+        totals[row.player_id] = {
+            key: value for key, value in row._mapping.items() if key != "player_id"
         }
+    return totals
 
 
-def populate_pro_players():
+def populate_pro_players(touched_player_ids: Optional[set[int]] = None):
     """
     Main function to populate the pro_players table.
+    Rebuilds every player by default; pass touched_player_ids to only
+    refresh the players that appeared in newly ingested games.
     """
     print("=" * 60)
     print("POPULATING PRO_PLAYERS TABLE")
     print("=" * 60)
 
-    with Session(engine) as session:
-        # Step 1: Collect all unique players
-        skater_info = get_latest_skater_info(session)
-        goalie_info = get_latest_goalie_info(session)
+    if touched_player_ids is not None:
+        if not touched_player_ids:
+            print("No touched players to update.")
+            return
+        print(f"Limiting rebuild to {len(touched_player_ids)} touched players")
 
-        # Combine (goalies take precedence if a player_id appears in both)
-        all_players = {**skater_info, **goalie_info}
+    # One transaction for the whole rebuild: reads, bulk writes and the commit
+    with Session(engine) as session, session.begin():
+        # Step 1: Collect all unique players
+        all_players = get_latest_player_info(session, touched_player_ids)
 
         print(f"\nTotal unique players: {len(all_players)}")
 
+        # Aggregate every player's season totals up front (one query per table)
+        print("Aggregating season totals...")
+        skater_totals = get_skater_season_totals(session, touched_player_ids)
+        goalie_totals = get_goalie_season_totals(session, touched_player_ids)
+
         # Step 2: Create/Update ProPlayers records
         print("\nCreating/updating player records...")
-        created_count = 0
-        updated_count = 0
+        # Only the keys are needed to split updates from inserts
+        existing_ids = set(session.exec(select(ProPlayers.player_id)).all())
 
+        updates = []
+        inserts = []
         for player_id, info in all_players.items():
-            # Check if player already exists
-            existing_player = session.exec(
-                select(ProPlayers).where(ProPlayers.player_id == player_id)
-            ).first()
-
-            # Calculate season totals
-            season_totals = calculate_season_totals(
-                session, player_id, info["is_goalie"]
-            )
-
-            if existing_player:
-                # Update existing player
-                existing_player.player_name = info["player_name"]
-                existing_player.team_abbrev = info["team_abbrev"]
-                existing_player.position = info["position"]
-                existing_player.jersey_number = info["jersey_number"]
-                existing_player.is_active = True
-
-                # Update season totals
-                for key, value in season_totals.items():
-                    setattr(existing_player, key, value)
-
-                updated_count += 1
+            # Look up pre-aggregated season totals
+            totals_by_player = goalie_totals if info["is_goalie"] else skater_totals
+            season_totals = totals_by_player.get(player_id, {})
+
+            row = {
+                "player_id": player_id,
+                "player_name": info["player_name"],
+                "team_abbrev": info["team_abbrev"],
+                "position": info["position"],
+                "jersey_number": info["jersey_number"],
+                "is_active": True,
+                **season_totals,
+            }
+            if player_id in existing_ids:
+                updates.append(row)
             else:
-                # Create new player
-                new_player = ProPlayers(
-                    player_id=player_id,
-                    player_name=info["player_name"],
-                    team_abbrev=info["team_abbrev"],
-                    position=info["position"],
-                    jersey_number=info["jersey_number"],
-                    is_active=True,
-                    **season_totals,
-                )
-                session.add(new_player)
-                created_count += 1
-
-            # Commit in batches of 100 for better performance
-            if (created_count + updated_count) % 100 == 0:
-                session.commit()
-                print(f"  Processed {created_count + updated_count} players...")
-
-        # Final commit
-        session.commit()
+                inserts.append(row)
+
+        # Write all changes in two bulk statements; session.begin() commits once
+        session.bulk_update_mappings(ProPlayers, updates)
+        session.bulk_insert_mappings(ProPlayers, inserts)
+
+        created_count = len(inserts)
+        updated_count = len(updates)
+        # all_players is only the rebuilt subset on incremental runs
+        total_count = session.exec(select(func.count(ProPlayers.player_id))).one()
 
         print("\n" + "=" * 60)
         print("✅ POPULATION COMPLETE!")
         print("=" * 60)
         print(f"Players created: {created_count}")
         print(f"Players updated: {updated_count}")
-        print(f"Total players in pro_players: {len(all_players)}")
+        print(f"Total players in pro_players: {total_count}")
 
 
 if __name__ == "__main__":
+    configure_bulk_pragmas()
     populate_pro_players()
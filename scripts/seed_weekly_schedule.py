@@ -5,44 +5,45 @@ Controller script to analyze the full schedule and save the
 weekly breakdown to the `team_schedule` table in the database.
 """
 
+import os
 import sys
+import csv
 import asyncio
-from collections import defaultdict
 from sqlmodel import Session
-from src.database.database import engine
+from src.database.database import configure_bulk_pragmas, engine
 from src.database.models import TeamSchedule
 from src.database.utils import clear_table, bulk_insert_data
-from src.core.constants import FANTASY_TIMEZONE
+from src.core.constants import FANTASY_TIMEZONE, WEEKLY_SCHEDULE_CSV
 
 # Import from the new utility files
-from src.utils.date_utils import get_week_dates, get_fantasy_week
+from src.utils.date_utils import get_fantasy_week, get_week_dates
 from src.api.nhl_api_utils import get_schedule
+from src.utils.http_client import run_and_close_client
 
 
 def count_games_per_team_per_week(schedule: dict) -> dict:
     """
     Count games per team per fantasy week and track opponents
     """
-    team_week_data = defaultdict(
-        lambda: defaultdict(lambda: {"count": 0, "opponents": [], "games": []})
-    )
-
-    for game_id, game_data in schedule.items():
+    team_week_data: dict = {}
+    # Games in schedule order, so each team's opponents stay in game order
+    for game_data in schedule.values():
         year, week = get_fantasy_week(game_data["date"])
         week_key = f"{year}-W{week:02d}"
 
         home_team = game_data["home_abbrev"]
         away_team = game_data["away_abbrev"]
+        for team, opponent in (
+            (home_team, f"vs {away_team}"),
+            (away_team, f"@ {home_team}"),
+        ):
+            week_data = team_week_data.setdefault(team, {}).setdefault(
+                week_key, {"count": 0, "opponents": [], "games": []}
+            )
+            week_data["count"] += 1
+            week_data["opponents"].append(opponent)
 
-        # Track for home team
-        team_week_data[home_team][week_key]["count"] += 1
-        team_week_data[home_team][week_key]["opponents"].append(f"vs {away_team}")
-
-        # Track for away team
-        team_week_data[away_team][week_key]["count"] += 1
-        team_week_data[away_team][week_key]["opponents"].append(f"@ {home_team}")
-
-    return {team: dict(weeks) for team, weeks in team_week_data.items()}
+    return team_week_data
 
 
 def save_to_database(team_week_data: dict):
@@ -84,12 +85,42 @@ def save_to_database(team_week_data: dict):
     )
 
 
+def export_to_csv(team_week_data: dict, output_path: str = WEEKLY_SCHEDULE_CSV):
+    """
+    Writes the weekly breakdown to a CSV file in the format
+    seed_team_schedule.py loads.
+    """
+    print(f"\nExporting weekly schedule to {output_path}...")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    rows = []
+    for team in sorted(team_week_data.keys()):
+        weeks = sorted(team_week_data[team].items())
+        for week_key, week_data in weeks:
+            year, week_num = week_key.split("-W")
+            monday, sunday = get_week_dates(int(year), int(week_num))
+            opponents = ", ".join(week_data["opponents"])
+            rows.append([team, week_key, monday, sunday, week_data["count"], opponents])
+
+    # Write everything in one writerows() call through a 1MB buffer
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["Team", "Week", "Monday_Date", "Sunday_Date", "Game_Count", "Opponents"]
+        )
+        writer.writerows(rows)
+
+    print(f"✅Exported {len(rows)} weekly schedule rows to {output_path}.")
+
+
 async def main():
     """
     Async main function to orchestrate fetching, analyzing,
     and saving the weekly schedule.
+    Pass --csv to also write the breakdown to WEEKLY_SCHEDULE_CSV.
     """
     force_refresh = "--force" in sys.argv
+    write_csv = "--csv" in sys.argv
 
     # 1. Get schedule (async)
     print("Fetching NHL schedule...")
@@ -104,9 +135,14 @@ async def main():
     )
     team_week_data = count_games_per_team_per_week(schedule)
 
-    # 3. Save the result to the DB (replaces export_to_csv)
+    # 3. Save the result to the DB
+    configure_bulk_pragmas()
     save_to_database(team_week_data)
 
+    # 4. Optionally export the same breakdown as a CSV
+    if write_csv:
+        export_to_csv(team_week_data)
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close_client(main()))
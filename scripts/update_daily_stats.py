@@ -8,16 +8,17 @@ This script now uses the PlayerStatsProcessor class.
 """
 
 import src.core.constants as constants
-import pytz
 import time
 import asyncio
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from src.database.database import init_db
 
 # --- 1. IMPORT THE CLASS, NOT THE FUNCTION ---
 from src.api.player_stats_fetcher import PlayerStatsProcessor
 from src.api.nhl_api_utils import get_schedule
 from src.utils.date_utils import get_schedule_by_date
+from src.utils.http_client import run_and_close_client
 
 
 async def main():
@@ -31,7 +32,7 @@ async def main():
     init_db()
 
     # --- Calculate yesterday's date ---
-    tz = pytz.timezone(constants.FANTASY_TIMEZONE)
+    tz = ZoneInfo(constants.FANTASY_TIMEZONE)
     yesterday = datetime.now(tz) - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
@@ -79,4 +80,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_and_close_client(main()))
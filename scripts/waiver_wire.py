@@ -8,9 +8,11 @@ This script runs entirely off your local DB and assumes
 the `pro_players` table is kept up-to-date by other scripts.
 """
 
-import pandas as pd
+from typing import Sequence
+
+from sqlalchemy import Row
 from sqlmodel import text
-from src.database.database import engine
+from src.database.database import engine_ro as engine
 from src.core.constants import SEASON_ID
 
 # We can combine finding free agents and hot players into one SQL query
@@ -46,7 +48,7 @@ QUERY_HOT_FREE_AGENTS = text(
 )
 
 
-def get_hot_players() -> pd.DataFrame:
+def get_hot_players() -> Sequence[Row]:
     """
     Queries the database for the hottest players who are
     marked as free agents (fantasy_team_id IS NULL).
@@ -55,25 +57,33 @@ def get_hot_players() -> pd.DataFrame:
 
     print("Querying database for top 25 hottest free agents...")
     with engine.connect() as conn:
-        df = pd.read_sql(QUERY_HOT_FREE_AGENTS, conn, params=params)
+        rows = conn.execute(QUERY_HOT_FREE_AGENTS, params).fetchall()
 
-    return df
+    return rows
 
 
 def main():
     # 1. Query our database for the hottest players
-    hot_players_df = get_hot_players()
+    hot_players = get_hot_players()
 
     # 2. Print the final report
     print("\n" + "=" * 60)
     print(" TOP 25 HOTTEST AVAILABLE PLAYERS (LAST 14 DAYS)")
     print("=" * 60)
 
-    if hot_players_df.empty:
+    if not hot_players:
         print("No hot players found on the waiver wire.")
     else:
-        hot_players_df["avg_fpts_last_14"] = hot_players_df["avg_fpts_last_14"].round(2)
-        print(hot_players_df.to_string(index=False))
+        print(
+            f"{'Player':<24} {'Team':<4} {'Pos':<6} {'Fantasy Team':<24} "
+            f"{'GP':>3} {'Avg FPTS':>8}"
+        )
+        for player in hot_players:
+            print(
+                f"{player.player_name:<24} {player.team_abbrev or '':<4} "
+                f"{player.position or '':<6} {player.fantasy_team:<24} "
+                f"{player.games_last_14:>3} {player.avg_fpts_last_14:>8.2f}"
+            )
 
     print("\n")
 
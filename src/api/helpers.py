@@ -1,23 +1,131 @@
 import asyncio
+import time
 import httpx
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_random_exponential,
+    retry_if_exception,
 )
 
-from typing import Optional, Tuple
+from contextlib import nullcontext
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import src.core.constants as constants
 from src.api.models import (
     PlayerGameLogResponse,
     GameBoxscoreResponse,
+    PlayerStatsByTeam,
+    TeamInfoAPI,
+    TeamStatsFromBoxscore,
     PlayerStatsFromBoxscore,
     GoalieStatsFromBoxscore,
     FinalPlayerGameStats,
 )
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Built once at import so each response skips per-call validator setup
+_BOXSCORE_ADAPTER = TypeAdapter(GameBoxscoreResponse)
+_PLAYER_LOG_ADAPTER = TypeAdapter(PlayerGameLogResponse)
+
+
+class RateLimiter:
+    """
+    Async token bucket: allows `max_rate` requests per `time_period` seconds
+    (bursting up to `max_rate`, but never less than one request, so rates
+    below 1 still let a request through). Use as `async with limiter:`
+    around a request.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._capacity = max(1.0, max_rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + elapsed * self.max_rate / self.time_period,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(
+                    (1 - self._tokens) * self.time_period / self.max_rate
+                )
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast once the API looks down: after `fail_max`
+    consecutive failures it opens, and every call raises CircuitOpenError
+    until `reset_timeout` seconds pass. It then goes half-open: the first
+    caller is let through as a single probe while everyone else keeps
+    failing fast. The probe's success closes the breaker; its failure
+    re-opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._opened_at is None
+
+    def check(self):
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError("NHL API circuit breaker is open")
+        # This caller is the probe. Restarting the window keeps the others
+        # out until it reports back (or for one more reset_timeout if it
+        # never does, e.g. it was cancelled).
+        self._opened_at = now
+        self._half_open = True
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._half_open or self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+            self._half_open = False
+
 
 def toi_to_seconds(toi_str: str) -> int:
     try:
@@ -27,61 +135,164 @@ def toi_to_seconds(toi_str: str) -> int:
         return 0
 
 
+async def fetch_all(
+    items: Sequence[T],
+    fetch: Callable[[T], Awaitable[R]],
+    worker_count: int = constants.CONCURRENCY_LIMIT,
+) -> List[Union[R, BaseException]]:
+    """
+    Runs `fetch(item)` for every item using a fixed pool of worker tasks
+    that pull from a shared queue, so at most `worker_count` requests are
+    in flight and only that many coroutines exist at once.
+    Results come back in the same order as `items`; a failed fetch leaves
+    its exception in place, like asyncio.gather(..., return_exceptions=True).
+    """
+    queue: asyncio.Queue[Tuple[int, T]] = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+    results: List[Union[R, BaseException]] = [None] * len(items)  # type: ignore[list-item]
+
+    async def worker():
+        # The queue is filled up front, so an empty queue means we're done
+        while not queue.empty():
+            index, item = queue.get_nowait()
+            try:
+                results[index] = await fetch(item)
+            except Exception as e:
+                results[index] = e
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(worker_count, len(items))):
+            tg.create_task(worker())
+    return results
+
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """True for transport errors (timeouts, resets) and retryable statuses."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+# Shared by every NHL API request in the process
+_api_breaker = CircuitBreaker(fail_max=20, reset_timeout=30)
+
+
 @retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(httpx.HTTPError),
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=0.5, max=10),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
 )
+async def get_with_retry(
+    client: httpx.AsyncClient, url: str, limiter: Optional[RateLimiter] = None
+) -> httpx.Response:
+    """
+    GETs `url` and raises for error statuses. Transport errors and
+    429/5xx responses are retried with jittered exponential backoff
+    (4 attempts); anything else, or the last failure, is raised to the
+    caller. Each attempt counts towards the shared circuit breaker.
+    """
+    _api_breaker.check()
+    try:
+        async with limiter or nullcontext():
+            res = await client.get(url, timeout=constants.API_TIMEOUT)
+        res.raise_for_status()
+    except httpx.HTTPError as e:
+        # Only outage-style errors count; a 404 means the API is up
+        if _is_retryable(e):
+            _api_breaker.record_failure()
+        else:
+            _api_breaker.record_success()
+        raise
+    _api_breaker.record_success()
+    return res
+
+
 async def fetch_player_log(
-    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, player_id: int
+    client: httpx.AsyncClient,
+    player_id: int,
+    limiter: Optional[RateLimiter] = None,
 ) -> Optional[Tuple[int, PlayerGameLogResponse]]:
     """Fetches one player's entire season game log."""
     url = f"{constants.WEB_URL}/player/{player_id}/game-log/{constants.SEASON_ID}/2"
-    async with semaphore:
-        try:
-            res = await client.get(url, timeout=constants.API_TIMEOUT)
-            res.raise_for_status()
-            data = res.json()
-            if not data:
-                return None
-            log_response = PlayerGameLogResponse(**data)
-            return (player_id, log_response)
-        except httpx.RequestError as e:
-            print(f"Error (Player Log {player_id}): {e}")
-            return None
-        except Exception as e:
-            print(f"Error (Player Log {player_id} parsing): {e}")
+    try:
+        res = await get_with_retry(client, url, limiter)
+        data = orjson.loads(res.content)
+        if not data:
             return None
+        log_response = _PLAYER_LOG_ADAPTER.validate_python(data)
+        return (player_id, log_response)
+    except CircuitOpenError:
+        # The API is down: let the caller abort instead of recording a gap
+        raise
+    except httpx.HTTPError as e:
+        print(f"Error (Player Log {player_id}): {e}")
+        return None
+    except Exception as e:
+        print(f"Error (Player Log {player_id} parsing): {e}")
+        return None
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(httpx.HTTPError),
-)
 async def fetch_game_boxscore(
-    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, game_id: int
+    client: httpx.AsyncClient,
+    game_id: int,
+    limiter: Optional[RateLimiter] = None,
 ) -> Optional[GameBoxscoreResponse]:
     """Fetches the full boxscore for a single game."""
     url = f"{constants.WEB_URL}/gamecenter/{game_id}/boxscore"
 
-    async with semaphore:
-        try:
-            res = await client.get(url, timeout=constants.API_TIMEOUT)
-            res.raise_for_status()
-            data = res.json()
-            if not data:
-                return None
+    try:
+        res = await get_with_retry(client, url, limiter)
+        data = orjson.loads(res.content)
+        if not data:
+            return None
 
-            boxscore_response = GameBoxscoreResponse(**data)
-            return boxscore_response
+        boxscore_response = _BOXSCORE_ADAPTER.validate_python(data)
+        return boxscore_response
 
-        except httpx.RequestError as e:
-            print(f"Error (Boxscore {game_id}): {e}")
-            return None
-        except Exception as e:
-            print(f"Error (Boxscore {game_id} parsing): {e}")
-            return None
+    except CircuitOpenError:
+        # The API is down: let the caller abort instead of recording a gap
+        raise
+    except httpx.HTTPError as e:
+        print(f"Error (Boxscore {game_id}): {e}")
+        return None
+    except Exception as e:
+        print(f"Error (Boxscore {game_id} parsing): {e}")
+        return None
+
+
+def _team_stats_from_cache(raw: dict) -> TeamStatsFromBoxscore:
+    return TeamStatsFromBoxscore.model_construct(
+        forwards=[
+            PlayerStatsFromBoxscore.model_construct(**p) for p in raw["forwards"]
+        ],
+        defense=[PlayerStatsFromBoxscore.model_construct(**p) for p in raw["defense"]],
+        goalies=[GoalieStatsFromBoxscore.model_construct(**g) for g in raw["goalies"]],
+    )
+
+
+def boxscore_from_cache(raw: dict) -> GameBoxscoreResponse:
+    """
+    Rebuilds a boxscore from its cached model_dump() without re-running
+    validation: it was validated when fetched, so only the nested models
+    need to be put back together (model_construct alone is not recursive).
+    """
+    player_stats = raw["playerByGameStats"]
+    return GameBoxscoreResponse.model_construct(
+        id=raw["id"],
+        gameDate=raw["gameDate"],
+        awayTeam=TeamInfoAPI.model_construct(**raw["awayTeam"]),
+        homeTeam=TeamInfoAPI.model_construct(**raw["homeTeam"]),
+        playerByGameStats=PlayerStatsByTeam.model_construct(
+            awayTeam=_team_stats_from_cache(player_stats["awayTeam"]),
+            homeTeam=_team_stats_from_cache(player_stats["homeTeam"]),
+        ),
+    )
 
 
 def merge_skater_stats(entry: FinalPlayerGameStats, stats: PlayerStatsFromBoxscore):
@@ -142,6 +353,86 @@ def calculate_fantasy_points_goalie(stats: FinalPlayerGameStats) -> float:
     return round(fpts, 2)
 
 
+# Weight vectors for the batch functions, built once at import. Column
+# order matches the term order of the scalar functions above.
+_SKATER_WEIGHT_KEYS = (
+    "goals",
+    "assists",
+    "ppPoints",
+    "shPoints",
+    "shots",
+    "blockedShots",
+    "hits",
+)
+_GOALIE_WEIGHT_KEYS = ("wins", "goalsAgainst", "saves", "shutouts", "otLosses")
+_SKATER_WEIGHTS = np.array(
+    [constants.SKATER_FPTS_WEIGHTS[k] for k in _SKATER_WEIGHT_KEYS], dtype=np.float64
+)
+_GOALIE_WEIGHTS = np.array(
+    [constants.GOALIE_FPTS_WEIGHTS[k] for k in _GOALIE_WEIGHT_KEYS], dtype=np.float64
+)
+
+
+def _weighted_sum(stats: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Row totals of stats * weights, added one column at a time, left to right.
+    A matrix product may reorder (or fuse) the additions, which can flip a
+    total across a rounding boundary; this keeps them identical to the
+    scalar functions.
+    """
+    weighted = stats * weights
+    total = weighted[:, 0]
+    for col in range(1, weighted.shape[1]):
+        total = total + weighted[:, col]
+    return total
+
+
+def calculate_fantasy_points_skater_batch(
+    entries: Sequence[FinalPlayerGameStats],
+) -> np.ndarray:
+    """
+    Vectorized calculate_fantasy_points_skater: returns one fantasy point
+    total per entry, in order. Sums in the same order as the scalar
+    version so the rounded results match it exactly.
+    """
+    stats = np.array(
+        [
+            (
+                s.goals,
+                s.assists,
+                s.powerPlayPoints,
+                s.shorthandedPoints,
+                s.sog,
+                s.blockedShots,
+                s.hits,
+            )
+            for s in entries
+        ],
+        dtype=np.int64,
+    ).reshape(-1, len(_SKATER_WEIGHT_KEYS))
+    return np.round(_weighted_sum(stats, _SKATER_WEIGHTS), 2)
+
+
+def calculate_fantasy_points_goalie_batch(
+    entries: Sequence[FinalPlayerGameStats],
+) -> np.ndarray:
+    """Vectorized calculate_fantasy_points_goalie, one total per entry."""
+    stats = np.array(
+        [
+            (
+                s.decision == constants.WIN_DECISION,
+                s.goalsAgainst or 0,
+                s.saves or 0,
+                s.goalsAgainst == 0 and (s.saves or 0) > 0,
+                s.decision == constants.OT_LOSS_DECISION,
+            )
+            for s in entries
+        ],
+        dtype=np.int64,
+    ).reshape(-1, len(_GOALIE_WEIGHT_KEYS))
+    return np.round(_weighted_sum(stats, _GOALIE_WEIGHTS), 2)
+
+
 def get_opponent_abbrev(boxscore: GameBoxscoreResponse, team_abbrev: str) -> str:
     """Determine opponent abbreviation based on player's team."""
     if team_abbrev == boxscore.homeTeam.abbrev:
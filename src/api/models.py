@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Optional
 from pydantic import BaseModel
 
@@ -124,10 +125,13 @@ class PlayerGameLogResponse(BaseModel):
     gameLog: list[PlayerGameLogEntry]
 
 
-class FinalPlayerGameStats(BaseModel):
+@dataclass(slots=True)
+class FinalPlayerGameStats:
     """
     Our new model to combine stats from the PlayerLog (Phase 1)
     and the Boxscore (Phase 2).
+    A plain slotted dataclass: one is built per player-game and mutated
+    field by field, so it skips pydantic's per-instance overhead.
     """
 
     # Common keys
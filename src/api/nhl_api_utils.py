@@ -1,18 +1,15 @@
 import httpx
+import orjson
 import asyncio
 import time
 from typing import Any, Dict, Optional
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
 from pydantic import ValidationError
 
 import src.core.constants as constants
+from .helpers import get_with_retry
 from .models import GamesResponse
 from src.utils.cache_utils import load_data_from_cache, save_data_to_cache
+from src.utils.http_client import get_client
 
 
 # --- Schedule Fetching ---
@@ -30,18 +27,13 @@ async def get_schedule_for_season(
 
     print(f"  Fetching full schedule for season {season_id}...")
 
-    async with httpx.AsyncClient() as client:
-        # We fetch every team's schedule for that season and combine them
-        unique_games = await get_all_unique_games(client, season_id=season_id)
+    client = await get_client()
+    # We fetch every team's schedule for that season and combine them
+    unique_games = await get_all_unique_games(client, season_id=season_id)
 
     return unique_games
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(httpx.HTTPError),
-)
 async def fetch_team_schedule(
     client: httpx.AsyncClient,
     semaphore: asyncio.Semaphore,
@@ -66,9 +58,8 @@ async def fetch_team_schedule(
 
     async with semaphore:
         try:
-            resp = await client.get(team_schedule_url, timeout=constants.API_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
+            resp = await get_with_retry(client, team_schedule_url)
+            data = orjson.loads(resp.content)
             games_response = GamesResponse(**data)
             team_games = {}
             for game in games_response.games:
@@ -101,37 +92,53 @@ async def get_all_unique_games(
     """
     unique_games = {}
     semaphore = asyncio.Semaphore(constants.CONCURRENCY_LIMIT)
-    tasks = []
 
-    for team in constants.NHL_TEAMS:
+    async with asyncio.TaskGroup() as tg:
         # Pass the season_id down to the fetcher
-        tasks.append(fetch_team_schedule(client, semaphore, team, season_id=season_id))
+        tasks = [
+            tg.create_task(
+                fetch_team_schedule(client, semaphore, team, season_id=season_id)
+            )
+            for team in constants.NHL_TEAMS
+        ]
 
-    results = await asyncio.gather(*tasks)
-    for team_games in results:
-        unique_games.update(team_games)
+    for task in tasks:
+        unique_games.update(task.result())
     return unique_games
 
 
+# In-process copy of the current season schedule, keyed by its cache file path,
+# so repeat calls in one run skip re-reading and re-parsing the JSON. Every
+# caller gets this same dict, so it must be treated as read-only.
+_schedule_memo: Dict[str, Dict[str, dict]] = {}
+
+
 async def get_schedule(force_refresh: bool = False) -> Dict[str, dict]:
     """
-    Get schedule for the CURRENT season - from cache or API.
+    Get schedule for the CURRENT season - from memory, cache or API.
+    The returned dict is the shared in-process copy: read it, don't modify it.
     """
     if not force_refresh:
+        memoized = _schedule_memo.get(constants.SCHEDULE_CACHE)
+        if memoized is not None:
+            return memoized
+
         cached = load_data_from_cache(constants.SCHEDULE_CACHE)
         if cached and isinstance(cached, dict):
+            _schedule_memo[constants.SCHEDULE_CACHE] = cached
             return cached
 
     print("Fetching fresh schedule from NHL API...")
     start_time = time.time()
 
-    async with httpx.AsyncClient() as client:
-        # Default behavior uses constants.SEASON_ID
-        unique_games = await get_all_unique_games(client)
+    client = await get_client()
+    # Default behavior uses constants.SEASON_ID
+    unique_games = await get_all_unique_games(client)
 
     end_time = time.time()
     print(
         f"Successfully Fetched {len(unique_games)} games in {end_time - start_time:.2f}s"
     )
     save_data_to_cache(unique_games, constants.SCHEDULE_CACHE)
+    _schedule_memo[constants.SCHEDULE_CACHE] = unique_games
     return unique_games
@@ -1,8 +1,7 @@
 import time
 import asyncio
-import httpx
 
-from typing import DefaultDict, Dict, List, Any, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 import src.core.constants as constants
 from sqlmodel import Session, select
@@ -11,29 +10,52 @@ from src.database.database import engine
 # Import ProPlayers model for the incremental update
 from src.database.models import PlayerGameStats, GoalieGameStats, ProPlayers
 
-from src.database.utils import bulk_merge_data
+from src.database.utils import begin_immediate, bulk_upsert_data
 from src.api.models import (
     PlayerGameLogResponse,
     GameBoxscoreResponse,
-    PlayerStatsFromBoxscore,
-    GoalieStatsFromBoxscore,
     FinalPlayerGameStats,
 )
-from collections import defaultdict
+from dataclasses import asdict
+from itertools import chain
 from datetime import datetime
 from src.utils.cache_utils import load_data_from_cache, save_data_to_cache
+from src.utils.http_client import get_client
 
 from .helpers import (
+    CircuitOpenError,
+    RateLimiter,
+    boxscore_from_cache,
+    fetch_all,
     fetch_game_boxscore,
     fetch_player_log,
     merge_skater_stats,
     merge_goalie_stats,
     get_opponent_abbrev,
-    calculate_fantasy_points_goalie,
-    calculate_fantasy_points_skater,
+    calculate_fantasy_points_goalie_batch,
+    calculate_fantasy_points_skater_batch,
     toi_to_seconds,
 )
 
+# Serializes Phase 5 across processors running concurrently in one event loop
+# (e.g. prior-season batches), so only one thread writes to SQLite at a time.
+_db_write_lock = asyncio.Lock()
+
+# Rows per INSERT ... ON CONFLICT executemany in Phase 5
+UPSERT_BATCH_SIZE = 500
+
+
+def _raise_if_circuit_open(results: List[Any]):
+    """
+    Aborts the run if any fetch was rejected by the open circuit breaker.
+    Carrying on would mark games with missing player logs as "final" in
+    the on-disk cache, and later cached runs would never re-fetch them.
+    """
+    for result in results:
+        if isinstance(result, CircuitOpenError):
+            raise result
+
+
 # --- MAIN PROCESSOR CLASS ---
 
 
@@ -43,19 +65,33 @@ class PlayerStatsProcessor:
     and updates the ProPlayers table incrementally.
     """
 
-    def __init__(self, use_cache: bool, perform_incremental_update: bool = True):
+    def __init__(
+        self,
+        use_cache: bool,
+        perform_incremental_update: bool = True,
+        max_rate: Optional[float] = None,
+    ):
         self.use_cache = use_cache
         # --- NEW: Control for incremental logic ---
         self.perform_incremental_update = perform_incremental_update
 
-        # This is the "state" that your script was passing around
-        self.game_cache_internal: DefaultDict[int, Dict[int, FinalPlayerGameStats]] = (
-            defaultdict(dict)
+        # Requests/second throttle for this processor's API calls.
+        # Defaults to constants.API_MAX_RATE; 0 turns it off.
+        if max_rate is None:
+            max_rate = constants.API_MAX_RATE
+        self.rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(max_rate) if max_rate > 0 else None
         )
+
+        # This is the "state" that your script was passing around
+        # Plain dict: entries are created explicitly, never by a lookup
+        self.game_cache_internal: Dict[int, Dict[int, FinalPlayerGameStats]] = {}
         self.boxscore_map: Dict[int, GameBoxscoreResponse] = {}
         self.game_stats_cache_on_disk: Dict[str, Any] = {}
         self.game_ids_to_fetch_fresh: List[int] = []
         self.game_ids_from_cache: List[int] = []
+        # Every player_id written to the DB by this processor (cached + fresh)
+        self.touched_players: set[int] = set()
 
     async def process_games(self, game_ids_to_process: List[int]):
         """
@@ -77,8 +113,10 @@ class PlayerStatsProcessor:
         self._update_on_disk_cache()
 
         # --- 4. Write all data (cached + fresh) to DB (Phase 5) ---
-        # This now includes the incremental ProPlayer update
-        self._write_data_to_db()
+        # This now includes the incremental ProPlayer update.
+        # Runs in a worker thread so other processors keep fetching meanwhile.
+        async with _db_write_lock:
+            await asyncio.to_thread(self._write_data_to_db)
 
         end_time = time.perf_counter()
         print(f"\n--- PROCESSING COMPLETE ({end_time - start_time:.2f}s) ---")
@@ -91,6 +129,9 @@ class PlayerStatsProcessor:
         Mutates: self.game_stats_cache_on_disk, self.game_ids_to_fetch_fresh,
                  self.game_ids_from_cache, self.boxscore_map, self.game_cache_internal
         """
+        # Drop duplicate ids (order kept) so no game is fetched twice
+        game_ids_to_process = list(dict.fromkeys(game_ids_to_process))
+
         cache_result = load_data_from_cache(constants.GAME_STATS_CACHE)
         self.game_stats_cache_on_disk = (
             cache_result if isinstance(cache_result, dict) else {}
@@ -118,12 +159,13 @@ class PlayerStatsProcessor:
                 continue
 
             try:
-                self.boxscore_map[game_id] = GameBoxscoreResponse(
-                    **cached_data["boxscore_raw"]
+                self.boxscore_map[game_id] = boxscore_from_cache(
+                    cached_data["boxscore_raw"]
                 )
+                players_in_game = self.game_cache_internal.setdefault(game_id, {})
                 for player_id_str, player_stats_dict in cached_data["players"].items():
-                    self.game_cache_internal[game_id][int(player_id_str)] = (
-                        FinalPlayerGameStats(**player_stats_dict)
+                    players_in_game[int(player_id_str)] = FinalPlayerGameStats(
+                        **player_stats_dict
                     )
             except Exception as e:
                 print(
@@ -139,139 +181,142 @@ class PlayerStatsProcessor:
         Fetch boxscores, fetch player logs, and merge the data.
         Reads:   self.game_ids_to_fetch_fresh
         Mutates: self.game_cache_internal, self.boxscore_map
+        Raises CircuitOpenError if the API circuit breaker opens mid-fetch.
         """
         if not self.game_ids_to_fetch_fresh:
             print("No fresh games to fetch.")
             return
 
         start_time = time.perf_counter()
-        semaphore = asyncio.Semaphore(constants.CONCURRENCY_LIMIT)
-        async with httpx.AsyncClient() as client:
-            # --- PHASE 1: Fetch boxscores ---
-            print(
-                f"\n--- Phase 1: Fetching {len(self.game_ids_to_fetch_fresh)} boxscores..."
-            )
-            boxscore_tasks = [
-                fetch_game_boxscore(client, semaphore, game_id)
-                for game_id in self.game_ids_to_fetch_fresh
-            ]
-            boxscore_results = await asyncio.gather(
-                *boxscore_tasks, return_exceptions=True
-            )
+        client = await get_client()
+        # --- PHASE 1: Fetch boxscores ---
+        print(
+            f"\n--- Phase 1: Fetching {len(self.game_ids_to_fetch_fresh)} boxscores..."
+        )
+        boxscore_results = await fetch_all(
+            self.game_ids_to_fetch_fresh,
+            lambda game_id: fetch_game_boxscore(client, game_id, self.rate_limiter),
+        )
 
-            player_ids_to_fetch_log: set[int] = set()
-            for i, result in enumerate(boxscore_results):
-                if isinstance(result, Exception):
-                    game_id = self.game_ids_to_fetch_fresh[i]
-                    print(
-                        f"Warning: Failed to fetch boxscore for game {game_id}: {result}"
+        _raise_if_circuit_open(boxscore_results)
+
+        player_ids_to_fetch_log: set[int] = set()
+        for i, result in enumerate(boxscore_results):
+            if isinstance(result, Exception):
+                game_id = self.game_ids_to_fetch_fresh[i]
+                print(f"Warning: Failed to fetch boxscore for game {game_id}: {result}")
+                continue
+            if result is None:
+                continue
+
+            assert isinstance(result, GameBoxscoreResponse)
+            self.boxscore_map[result.id] = result  # Mutate map
+
+            away = result.playerByGameStats.awayTeam
+            home = result.playerByGameStats.homeTeam
+            player_ids_to_fetch_log.update(
+                player_stats.playerId
+                for player_stats in chain.from_iterable(
+                    (
+                        away.forwards,
+                        away.defense,
+                        away.goalies,
+                        home.forwards,
+                        home.defense,
+                        home.goalies,
                     )
-                    continue
-                if result is None:
-                    continue
-
-                assert isinstance(result, GameBoxscoreResponse)
-                self.boxscore_map[result.id] = result  # Mutate map
-
-                all_players: List[
-                    Union[PlayerStatsFromBoxscore, GoalieStatsFromBoxscore]
-                ] = (
-                    result.playerByGameStats.awayTeam.forwards
-                    + result.playerByGameStats.awayTeam.defense
-                    + result.playerByGameStats.awayTeam.goalies
-                    + result.playerByGameStats.homeTeam.forwards
-                    + result.playerByGameStats.homeTeam.defense
-                    + result.playerByGameStats.homeTeam.goalies
                 )
-                for player_stats in all_players:
-                    player_ids_to_fetch_log.add(player_stats.playerId)
-
-            phase1_time = time.perf_counter()
-            print(
-                f"Phase 1 complete. Found {len(player_ids_to_fetch_log)} unique players. ({phase1_time - start_time:.2f}s)"
             )
 
-            # --- PHASE 2: Fetch player logs ---
-            print(
-                f"\n--- Phase 2: Fetching logs for {len(player_ids_to_fetch_log)} players..."
-            )
-            player_log_tasks = [
-                fetch_player_log(client, semaphore, player_id)
-                for player_id in player_ids_to_fetch_log
-            ]
-            player_log_results = await asyncio.gather(
-                *player_log_tasks, return_exceptions=True
-            )
+        phase1_time = time.perf_counter()
+        print(
+            f"Phase 1 complete. Found {len(player_ids_to_fetch_log)} unique players. ({phase1_time - start_time:.2f}s)"
+        )
 
-            for log_result in player_log_results:
-                if isinstance(log_result, Exception):
-                    print(f"Warning: Failed to process player log: {log_result}")
-                    continue
-                if log_result is None:
-                    continue
-
-                assert isinstance(log_result, tuple) and len(log_result) == 2
-                player_id: int = log_result[0]
-                log_response: PlayerGameLogResponse = log_result[1]
-
-                for game in log_response.gameLog:
-                    if game.gameId in self.game_ids_to_fetch_fresh:
-                        final_stats = FinalPlayerGameStats(
-                            playerId=player_id,
-                            gameId=game.gameId,
-                            teamAbbrev=game.teamAbbrev,
-                            gameDate=game.gameDate,
-                            powerPlayPoints=game.powerPlayPoints,
-                            shorthandedPoints=game.shorthandedPoints,
-                            toi=game.toi,
-                            shifts=game.shifts,
-                            pim=game.pim,
-                        )
-                        # Mutate cache
-                        self.game_cache_internal[game.gameId][player_id] = final_stats
+        # --- PHASE 2: Fetch player logs ---
+        print(
+            f"\n--- Phase 2: Fetching logs for {len(player_ids_to_fetch_log)} players..."
+        )
+        player_log_results = await fetch_all(
+            list(player_ids_to_fetch_log),
+            lambda player_id: fetch_player_log(client, player_id, self.rate_limiter),
+        )
 
-            phase2_time = time.perf_counter()
-            print(
-                f"Phase 2 complete. Populated internal cache. ({phase2_time - phase1_time:.2f}s)"
-            )
+        _raise_if_circuit_open(player_log_results)
 
-            # --- PHASE 3: Merge boxscore data ---
-            print("\n--- Phase 3: Merging boxscore data...")
-            merge_count = 0
-            for game_id in self.game_ids_to_fetch_fresh:
-                boxscore = self.boxscore_map.get(game_id)
-                if not boxscore:
-                    continue
-
-                assert isinstance(boxscore, GameBoxscoreResponse)
-
-                all_players_phase3: List[
-                    Union[PlayerStatsFromBoxscore, GoalieStatsFromBoxscore]
-                ] = (
-                    boxscore.playerByGameStats.awayTeam.forwards
-                    + boxscore.playerByGameStats.awayTeam.defense
-                    + boxscore.playerByGameStats.awayTeam.goalies
-                    + boxscore.playerByGameStats.homeTeam.forwards
-                    + boxscore.playerByGameStats.homeTeam.defense
-                    + boxscore.playerByGameStats.homeTeam.goalies
-                )
+        fresh_game_ids = set(self.game_ids_to_fetch_fresh)
+        for log_result in player_log_results:
+            if isinstance(log_result, Exception):
+                print(f"Warning: Failed to process player log: {log_result}")
+                continue
+            if log_result is None:
+                continue
 
-                for player_stats in all_players_phase3:
-                    player_id = player_stats.playerId
-                    if player_id in self.game_cache_internal[game_id]:
-                        entry_to_update = self.game_cache_internal[game_id][player_id]
-
-                        if isinstance(player_stats, PlayerStatsFromBoxscore):
-                            merge_skater_stats(entry_to_update, player_stats)
-                            merge_count += 1
-                        elif isinstance(player_stats, GoalieStatsFromBoxscore):
-                            merge_goalie_stats(entry_to_update, player_stats)
-                            merge_count += 1
-
-            phase3_time = time.perf_counter()
-            print(
-                f"Phase 3 complete. Merged {merge_count} records. ({phase3_time - phase2_time:.2f}s)"
-            )
+            assert isinstance(log_result, tuple) and len(log_result) == 2
+            player_id: int = log_result[0]
+            log_response: PlayerGameLogResponse = log_result[1]
+
+            for game in log_response.gameLog:
+                if game.gameId in fresh_game_ids:
+                    final_stats = FinalPlayerGameStats(
+                        playerId=player_id,
+                        gameId=game.gameId,
+                        teamAbbrev=game.teamAbbrev,
+                        gameDate=game.gameDate,
+                        powerPlayPoints=game.powerPlayPoints,
+                        shorthandedPoints=game.shorthandedPoints,
+                        toi=game.toi,
+                        shifts=game.shifts,
+                        pim=game.pim,
+                    )
+                    # Mutate cache
+                    self.game_cache_internal.setdefault(game.gameId, {})[player_id] = (
+                        final_stats
+                    )
+
+        phase2_time = time.perf_counter()
+        print(
+            f"Phase 2 complete. Populated internal cache. ({phase2_time - phase1_time:.2f}s)"
+        )
+
+        # --- PHASE 3: Merge boxscore data ---
+        print("\n--- Phase 3: Merging boxscore data...")
+        merge_count = 0
+        for game_id in self.game_ids_to_fetch_fresh:
+            boxscore = self.boxscore_map.get(game_id)
+            if not boxscore:
+                continue
+
+            assert isinstance(boxscore, GameBoxscoreResponse)
+
+            # Look the game up once, not once per player
+            players_in_game = self.game_cache_internal.get(game_id)
+            if not players_in_game:
+                continue
+
+            away = boxscore.playerByGameStats.awayTeam
+            home = boxscore.playerByGameStats.homeTeam
+
+            # The lists already tell skaters and goalies apart,
+            # so merge each kind in its own pass
+            for skater_stats in chain(
+                away.forwards, away.defense, home.forwards, home.defense
+            ):
+                entry_to_update = players_in_game.get(skater_stats.playerId)
+                if entry_to_update is not None:
+                    merge_skater_stats(entry_to_update, skater_stats)
+                    merge_count += 1
+
+            for goalie_stats in chain(away.goalies, home.goalies):
+                entry_to_update = players_in_game.get(goalie_stats.playerId)
+                if entry_to_update is not None:
+                    merge_goalie_stats(entry_to_update, goalie_stats)
+                    merge_count += 1
+
+        phase3_time = time.perf_counter()
+        print(
+            f"Phase 3 complete. Merged {merge_count} records. ({phase3_time - phase2_time:.2f}s)"
+        )
 
     def _update_on_disk_cache(self):
         """
@@ -281,7 +326,7 @@ class PlayerStatsProcessor:
         Mutates: self.game_stats_cache_on_disk
         """
         print("\n--- Phase 4: Updating on-disk cache...")
-        updated_count = 0
+        fresh_entries: Dict[str, Any] = {}
         for game_id in self.game_ids_to_fetch_fresh:
             boxscore = self.boxscore_map.get(game_id)
             if not boxscore:
@@ -291,43 +336,79 @@ class PlayerStatsProcessor:
             status = "final"  # Assuming all fetched games are final
 
             players_dict = {
-                str(pid): stats.model_dump()
-                for pid, stats in self.game_cache_internal[game_id].items()
+                str(pid): asdict(stats)
+                for pid, stats in self.game_cache_internal.get(game_id, {}).items()
             }
 
-            # Mutate on-disk cache object
-            self.game_stats_cache_on_disk[str(game_id)] = {
+            fresh_entries[str(game_id)] = {
                 "cached_at": datetime.utcnow().isoformat() + "Z",
                 "status": status,
                 "boxscore_raw": boxscore.model_dump(),
                 "players": players_dict,
             }
-            updated_count += 1
 
-        if updated_count > 0:
+        if fresh_entries:
+            # Re-read the file right before saving: other processors running
+            # concurrently may have written games since our initial load.
+            cache_result = load_data_from_cache(constants.GAME_STATS_CACHE)
+            if isinstance(cache_result, dict):
+                self.game_stats_cache_on_disk = cache_result
+
+            # Mutate on-disk cache object
+            self.game_stats_cache_on_disk.update(fresh_entries)
             save_data_to_cache(
                 self.game_stats_cache_on_disk, constants.GAME_STATS_CACHE
             )
-            print(f"  ✅ Saved {updated_count} games to on-disk cache.")
+            print(f"  ✅ Saved {len(fresh_entries)} games to on-disk cache.")
         else:
             print("  - On-disk cache is already up-to-date.")
 
-    def _write_data_to_db(self):
+    def _calculate_all_fantasy_points(self) -> Dict[Tuple[int, int], float]:
         """
-        PHASE 5: Transform data, write game stats to DB, and
-        incrementally update the ProPlayers table.
-        Reads: self.game_cache_internal, self.boxscore_map, self.game_ids_to_fetch_fresh
+        Computes fantasy points for every cached player-game in two vectorized
+        passes (skaters, goalies) instead of one Python call per row.
+        Returns {(game_id, player_id): total_fpts}.
+        Reads: self.game_cache_internal
         """
-        print("\n--- Phase 5: Writing to database and updating ProPlayers...")
-
-        skater_records_to_merge = []
-        goalie_records_to_merge = []
+        skater_keys: List[Tuple[int, int]] = []
+        skater_entries: List[FinalPlayerGameStats] = []
+        goalie_keys: List[Tuple[int, int]] = []
+        goalie_entries: List[FinalPlayerGameStats] = []
+        for game_id, players in self.game_cache_internal.items():
+            for player_id, stats in players.items():
+                if stats.position in constants.GOALIE_POSITIONS:
+                    goalie_keys.append((game_id, player_id))
+                    goalie_entries.append(stats)
+                else:
+                    skater_keys.append((game_id, player_id))
+                    skater_entries.append(stats)
 
-        # --- NEW: Lists for *only* new stats ---
-        skater_records_for_incremental_update = []
-        goalie_records_for_incremental_update = []
+        fantasy_points = dict(
+            zip(
+                skater_keys,
+                calculate_fantasy_points_skater_batch(skater_entries).tolist(),
+            )
+        )
+        fantasy_points.update(
+            zip(
+                goalie_keys,
+                calculate_fantasy_points_goalie_batch(goalie_entries).tolist(),
+            )
+        )
+        return fantasy_points
 
-        # --- 1. Transform Pydantic models to SQLModel objects ---
+    def _build_game_records(
+        self,
+    ) -> Iterator[Tuple[Any, dict, bool]]:
+        """
+        Transforms the cached Pydantic stats into DB rows, one at a time.
+        Yields (model_class, row, is_fresh): row is a plain dict of column
+        values for model_class, and is_fresh means the game was fetched
+        from the API in this run.
+        Reads: self.game_cache_internal, self.boxscore_map, self.game_ids_to_fetch_fresh
+        """
+        fresh_game_ids = set(self.game_ids_to_fetch_fresh)
+        fantasy_points = self._calculate_all_fantasy_points()
         for game_id, players in self.game_cache_internal.items():
             boxscore = self.boxscore_map.get(game_id)
             if not boxscore:
@@ -343,7 +424,7 @@ class PlayerStatsProcessor:
 
                 if stats.position in constants.GOALIE_POSITIONS:
                     # Goalie Record
-                    goalie_record = GoalieGameStats(
+                    goalie_record = dict(
                         game_id=stats.gameId,
                         player_id=stats.playerId,
                         season=constants.SEASON_ID,
@@ -370,20 +451,16 @@ class PlayerStatsProcessor:
                             else 0
                         ),
                         ot_losses=1 if stats.decision == "O" else 0,
-                        total_fpts=calculate_fantasy_points_goalie(stats),
+                        total_fpts=fantasy_points[(game_id, player_id)],
                     )
-                    goalie_records_to_merge.append(goalie_record)
-
-                    # NEW: Only add to incremental list if it was a freshly fetched game
-                    if game_id in self.game_ids_to_fetch_fresh:
-                        goalie_records_for_incremental_update.append(goalie_record)
+                    yield GoalieGameStats, goalie_record, game_id in fresh_game_ids
                 else:
                     # Skater Record
                     shooting_pct = None
                     if stats.sog > 0:
                         shooting_pct = stats.goals / stats.sog
 
-                    skater_record = PlayerGameStats(
+                    skater_record = dict(
                         game_id=stats.gameId,
                         player_id=stats.playerId,
                         season=constants.SEASON_ID,
@@ -403,30 +480,72 @@ class PlayerStatsProcessor:
                         shooting_pct=shooting_pct,
                         blocked_shots=stats.blockedShots,
                         hits=stats.hits,
-                        total_fpts=calculate_fantasy_points_skater(stats),
+                        total_fpts=fantasy_points[(game_id, player_id)],
                         toi_seconds=toi_to_seconds(stats.toi),
                         shifts=stats.shifts,
                     )
-                    skater_records_to_merge.append(skater_record)
+                    yield PlayerGameStats, skater_record, game_id in fresh_game_ids
 
-                    # NEW: Only add to incremental list if it was a freshly fetched game
-                    if game_id in self.game_ids_to_fetch_fresh:
-                        skater_records_for_incremental_update.append(skater_record)
+    def _write_data_to_db(self):
+        """
+        PHASE 5: Transform data, write game stats to DB, and
+        incrementally update the ProPlayers table.
+        Game stats are upserted in batches of UPSERT_BATCH_SIZE rows as they
+        are built, so only one batch of row dicts is held at a time.
+        Reads: self.game_cache_internal, self.boxscore_map, self.game_ids_to_fetch_fresh
+        """
+        print("\n--- Phase 5: Writing to database and updating ProPlayers...")
 
-        # --- 2. & 3. Write stats and update ProPlayers in one transaction ---
+        # Only stats from freshly fetched games feed the incremental update
+        skater_records_for_incremental_update = []
+        goalie_records_for_incremental_update = []
+
+        upsert_buffers: Dict[Any, List[dict]] = {
+            PlayerGameStats: [],
+            GoalieGameStats: [],
+        }
+        upserted_counts: Dict[Any, int] = {PlayerGameStats: 0, GoalieGameStats: 0}
+
+        # --- Write stats and update ProPlayers in one transaction ---
         with Session(engine) as session:
             try:
-                # Step 2: Merge ALL game stats (from cache + fresh)
+                # Take the write lock now rather than at the first upsert
+                begin_immediate(session)
+
+                # Step 1: Upsert ALL game stats (from cache + fresh)
                 # This ensures game stats are always in the DB (handles your scenario)
-                print("  - Merging all game stats...")
-                skater_merged = bulk_merge_data(session, skater_records_to_merge)
-                goalie_merged = bulk_merge_data(session, goalie_records_to_merge)
+                print("  - Upserting all game stats...")
+                for model_class, row, is_fresh in self._build_game_records():
+                    self.touched_players.add(row["player_id"])
+                    if is_fresh:
+                        if model_class is GoalieGameStats:
+                            goalie_records_for_incremental_update.append(row)
+                        else:
+                            skater_records_for_incremental_update.append(row)
+
+                    buffer = upsert_buffers[model_class]
+                    buffer.append(row)
+                    if len(buffer) >= UPSERT_BATCH_SIZE:
+                        upserted_counts[model_class] += bulk_upsert_data(
+                            session, model_class, buffer
+                        )
+                        buffer.clear()
+
+                # Flush whatever is left in the buffers
+                for model_class, buffer in upsert_buffers.items():
+                    if buffer:
+                        upserted_counts[model_class] += bulk_upsert_data(
+                            session, model_class, buffer
+                        )
+                        buffer.clear()
+
                 print(
-                    f"  - Merged {skater_merged} skater and {goalie_merged} goalie records."
+                    f"  - Upserted {upserted_counts[PlayerGameStats]} skater and "
+                    f"{upserted_counts[GoalieGameStats]} goalie records."
                 )
 
                 # --- MODIFIED: Add a guard ---
-                # Step 3: Incrementally update ProPlayers
+                # Step 2: Incrementally update ProPlayers
                 # Only run this if the processor is told to.
                 if self.perform_incremental_update:
                     self._update_pro_players_incrementally(
@@ -453,8 +572,8 @@ class PlayerStatsProcessor:
     def _update_pro_players_incrementally(
         self,
         session: Session,
-        new_skater_stats: List[PlayerGameStats],
-        new_goalie_stats: List[GoalieGameStats],
+        new_skater_stats: List[dict],
+        new_goalie_stats: List[dict],
     ):
         """
         Incrementally updates the ProPlayers table based on new game stats.
@@ -462,8 +581,8 @@ class PlayerStatsProcessor:
         Runs *within* the main DB session.
         """
         print("  - Incrementally updating ProPlayers table...")
-        player_ids = {s.player_id for s in new_skater_stats} | {
-            g.player_id for g in new_goalie_stats
+        player_ids = {s["player_id"] for s in new_skater_stats} | {
+            g["player_id"] for g in new_goalie_stats
         }
         if not player_ids:
             print("    - No players to update.")
@@ -471,7 +590,7 @@ class PlayerStatsProcessor:
 
         # Fetch all players to update in one query
         existing_players_list = session.exec(
-            select(ProPlayers).where(ProPlayers.player_id in (player_ids))
+            select(ProPlayers).where(ProPlayers.player_id.in_(player_ids))
         ).all()
         existing_players_map = {p.player_id: p for p in existing_players_list}
 
@@ -479,75 +598,79 @@ class PlayerStatsProcessor:
 
         # Process skaters
         for stat in new_skater_stats:
-            player = existing_players_map.get(stat.player_id)
-            safe_player_name = stat.player_name or "Unknown"
+            player = existing_players_map.get(stat["player_id"])
+            safe_player_name = stat["player_name"] or "Unknown"
             if not player:
                 # Create a new ProPlayer if they don't exist
                 player = ProPlayers(
-                    player_id=stat.player_id,
+                    player_id=stat["player_id"],
                     is_active=True,
                     is_goalie=False,
                     player_name=safe_player_name,
                 )
                 session.add(player)
-                existing_players_map[stat.player_id] = player
+                existing_players_map[stat["player_id"]] = player
                 print(f"    - Created new ProPlayer: {safe_player_name}")
 
             # Update player info (always use the latest game's info)
             player.player_name = safe_player_name
-            player.team_abbrev = stat.team_abbrev
-            player.position = stat.position
-            player.jersey_number = stat.jersey_number
+            player.team_abbrev = stat["team_abbrev"]
+            player.position = stat["position"]
+            player.jersey_number = stat["jersey_number"]
 
             # Increment seasonal stats
             # This logic assumes you are not re-processing old, already-processed games.
-            # The bulk_merge_data for game stats handles updates, but this incremental
+            # The bulk_upsert_data for game stats handles updates, but this incremental
             # logic is additive. If you re-run on old data, this will double-count.
             # For a daily script, this is correct.
             player.season_games_played = (player.season_games_played or 0) + 1
-            player.season_total_fpts = (player.season_total_fpts or 0) + stat.total_fpts
-            player.season_goals = (player.season_goals or 0) + stat.goals
-            player.season_assists = (player.season_assists or 0) + stat.assists
-            player.season_pp_points = (player.season_pp_points or 0) + stat.pp_points
-            player.season_sh_points = (player.season_sh_points or 0) + stat.sh_points
-            player.season_shots = (player.season_shots or 0) + stat.shots
-            player.season_blocked_shots = (
-                player.season_blocked_shots or 0
-            ) + stat.blocked_shots
-            player.season_hits = (player.season_hits or 0) + stat.hits
+            player.season_total_fpts = (player.season_total_fpts or 0) + stat[
+                "total_fpts"
+            ]
+            player.season_goals = (player.season_goals or 0) + stat["goals"]
+            player.season_assists = (player.season_assists or 0) + stat["assists"]
+            player.season_pp_points = (player.season_pp_points or 0) + stat["pp_points"]
+            player.season_sh_points = (player.season_sh_points or 0) + stat["sh_points"]
+            player.season_shots = (player.season_shots or 0) + stat["shots"]
+            player.season_blocked_shots = (player.season_blocked_shots or 0) + stat[
+                "blocked_shots"
+            ]
+            player.season_hits = (player.season_hits or 0) + stat["hits"]
             updated_count += 1
 
         # Process goalies
         for stat in new_goalie_stats:
-            player = existing_players_map.get(stat.player_id)
-            safe_player_name = stat.player_name or "Unknown"
+            player = existing_players_map.get(stat["player_id"])
+            safe_player_name = stat["player_name"] or "Unknown"
             if not player:
                 player = ProPlayers(
-                    player_id=stat.player_id,
+                    player_id=stat["player_id"],
                     is_active=True,
                     is_goalie=True,
                     player_name=safe_player_name,
                 )
                 session.add(player)
-                existing_players_map[stat.player_id] = player
-                print(f"    - Created new ProPlayer: {stat.player_name}")
+                existing_players_map[stat["player_id"]] = player
+                print(f"    - Created new ProPlayer: {stat['player_name']}")
 
             # Update player info
-            player.team_abbrev = stat.team_abbrev
-            player.position = stat.position  # "Goalie"
-            player.jersey_number = stat.jersey_number
+            player.team_abbrev = stat["team_abbrev"]
+            player.position = stat["position"]  # "Goalie"
+            player.jersey_number = stat["jersey_number"]
             player.is_goalie = True  # Ensure this is set
 
             # Increment seasonal stats
             player.season_games_played = (player.season_games_played or 0) + 1
-            player.season_total_fpts = (player.season_total_fpts or 0) + stat.total_fpts
-            player.season_wins = (player.season_wins or 0) + stat.wins
-            player.season_shutouts = (player.season_shutouts or 0) + stat.shutouts
-            player.season_ot_losses = (player.season_ot_losses or 0) + stat.ot_losses
-            player.season_saves = (player.season_saves or 0) + stat.saves
-            player.season_goals_against = (
-                player.season_goals_against or 0
-            ) + stat.goals_against
+            player.season_total_fpts = (player.season_total_fpts or 0) + stat[
+                "total_fpts"
+            ]
+            player.season_wins = (player.season_wins or 0) + stat["wins"]
+            player.season_shutouts = (player.season_shutouts or 0) + stat["shutouts"]
+            player.season_ot_losses = (player.season_ot_losses or 0) + stat["ot_losses"]
+            player.season_saves = (player.season_saves or 0) + stat["saves"]
+            player.season_goals_against = (player.season_goals_against or 0) + stat[
+                "goals_against"
+            ]
             updated_count += 1
 
         print(f"    - Updated {updated_count} ProPlayer records.")
@@ -24,6 +24,10 @@ FANTASY_TIMEZONE = os.getenv("FANTASY_TIMEZONE", "US/Eastern")
 # --- Concurrency ---
 CONCURRENCY_LIMIT = int(os.getenv("CONCURRENCY_LIMIT", "50"))
 API_TIMEOUT = int(os.getenv("API_TIMEOUT", "10"))
+# Max NHL API requests per second per processor. Off (0) by default: the
+# API has no documented limit, so fetching is only bounded by
+# CONCURRENCY_LIMIT unless a rate is set here.
+API_MAX_RATE = float(os.getenv("API_MAX_RATE", "0"))
 
 # --- FANTASY LEAGUE SCORING WEIGHTS ---
 # (Matches your script's calculations)
@@ -4,6 +4,7 @@ This is the central file for all database models and connection logic.
 
 from pathlib import Path
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine
 from .models import (
     TeamSchedule,
@@ -19,7 +20,77 @@ from .models import (
 DATABASE_FILE = "data/nhl_stats.db"
 sqlite_url = f"sqlite:///{DATABASE_FILE}"
 
-engine = create_engine(sqlite_url)
+# check_same_thread=False: the stats processor writes from a worker thread
+engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Applies the default PRAGMAs to every new SQLite connection:
+    WAL journal (readers don't block the writer), synchronous=NORMAL (no fsync
+    per commit in WAL mode), a 64MB page cache, in-memory temp tables,
+    a 5s busy timeout and 256MB of memory-mapped I/O.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+# Explicit name for the read/write engine used by the seeders
+engine_rw = engine
+
+# Read-only engine for reporting scripts (e.g. waiver_wire).
+# Has its own pool, so reads never queue behind the seeder's connections,
+# and under WAL they don't block on its write lock either.
+engine_ro = create_engine(
+    f"sqlite:///file:{DATABASE_FILE}?mode=ro&uri=true",
+    connect_args={"check_same_thread": False},
+    pool_size=8,
+)
+
+
+@event.listens_for(engine_ro, "connect")
+def _set_sqlite_read_pragmas(dbapi_connection, connection_record):
+    """
+    Applies the read-side PRAGMAs to every new read-only connection.
+    journal_mode/synchronous are left alone since they need write access.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+# --- Bulk Write Tuning ---
+
+
+def _set_bulk_pragmas(dbapi_connection, connection_record):
+    """Applies the bulk-load PRAGMAs to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA cache_size=-200000")
+    cursor.close()
+
+
+def configure_bulk_pragmas(db_engine=engine):
+    """
+    Tunes SQLite for bulk seeding on top of the default PRAGMAs by raising
+    the page cache to ~200MB.
+    Applies to every connection the engine opens from now on. Safe to call
+    more than once.
+    """
+    if not event.contains(db_engine, "connect", _set_bulk_pragmas):
+        event.listen(db_engine, "connect", _set_bulk_pragmas)
+    # Drop pooled connections so every later checkout gets the PRAGMAs
+    db_engine.dispose()
 
 
 # --- Initialization Function ---
@@ -36,6 +107,12 @@ def init_db():
 
     # Now this knows about PlayerGameStats and GoalieGameStats
     SQLModel.metadata.create_all(engine)
+
+    # create_all skips tables that already exist, so add any indexes
+    # declared on the models since the database was first created
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     print(f"Database {DATABASE_FILE} and tables created successfully.")
 
 
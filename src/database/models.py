@@ -64,7 +64,7 @@ class ProPlayers(SQLModel, table=True):
     # This links a player to a fantasy team.
     # If fantasy_team_id is NULL, the player is a Free Agent.
     fantasy_team_id: Optional[int] = Field(
-        default=None, foreign_key="fantasy_team.team_id"
+        default=None, foreign_key="fantasy_team.team_id", index=True
     )
     fantasy_team: Optional[FantasyTeam] = Relationship(back_populates="players")
 
@@ -140,6 +140,8 @@ class PlayerGameStats(SQLModel, table=True):
         Index("idx_team", "team_abbrev"),
         Index("idx_team_name", "team_name"),
         Index("idx_player_team", "player_id", "team_abbrev"),
+        # Recent-form queries: season + date range, grouped by player
+        Index("idx_season_date_player", "season", "game_date", "player_id"),
     )
 
 
@@ -186,4 +188,6 @@ class GoalieGameStats(SQLModel, table=True):
         Index("idx_goalie_team", "team_abbrev"),
         Index("idx_goalie_team_name", "team_name"),
         Index("idx_goalie_player_team", "player_id", "team_abbrev"),
+        # Recent-form queries: season + date range, grouped by player
+        Index("idx_goalie_season_date_player", "season", "game_date", "player_id"),
     )
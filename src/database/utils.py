@@ -1,4 +1,6 @@
-from sqlmodel import Session, func, select, desc
+from operator import itemgetter
+
+from sqlmodel import Session, select, desc
 from typing import List, Dict, Union, Any, cast
 
 # Import your models
@@ -31,6 +33,15 @@ def clear_table(session: Session, model_class: Any) -> int:
     return count
 
 
+def begin_immediate(session: Session):
+    """
+    Opens the session's transaction with BEGIN IMMEDIATE, so SQLite takes
+    the write lock up front instead of on the first write. Call it before
+    any other statement on the session; commit/rollback end it as usual.
+    """
+    session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+
+
 def bulk_insert_data(session: Session, data: List[Any]):
     """
     Inserts a list of SQLModel objects into the database in a single session.
@@ -41,6 +52,57 @@ def bulk_insert_data(session: Session, data: List[Any]):
     print("Bulk insert complete.")
 
 
+def bulk_insert_rows(session: Session, model_class: Any, rows: List[dict]):
+    """
+    Inserts a list of plain dicts (column name -> value) into the table for
+    model_class without building an ORM object per row.
+    """
+    print(f"Bulk inserting {len(rows)} rows into {model_class.__tablename__}...")
+    session.bulk_insert_mappings(model_class, rows)
+    session.commit()
+    print("Bulk insert complete.")
+
+
+def bulk_upsert_data(session: Session, model_class: Any, rows: List[dict]) -> int:
+    """
+    Inserts or updates plain dicts (column name -> value) in one
+    INSERT ... ON CONFLICT (primary key) DO UPDATE statement, run with the
+    driver's executemany on the session's own connection (so it joins the
+    session's transaction). Does NOT commit the session.
+
+    The raw cursor skips SQLAlchemy's type processing, so rows must already
+    hold driver-ready values (int/float/str/bool/None, as our tables use)
+    and have a value for every column.
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        print("No data to upsert.")
+        return 0
+
+    table = model_class.__table__
+    columns = [column.name for column in table.columns]
+    pk_columns = [column.name for column in table.primary_key.columns]
+    update_columns = [name for name in columns if name not in pk_columns]
+
+    statement = (
+        f"INSERT INTO {table.name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT ({', '.join(pk_columns)}) DO UPDATE SET "
+        + ", ".join(f"{name} = excluded.{name}" for name in update_columns)
+    )
+    row_values = itemgetter(*columns)
+
+    print(f"Upserting {len(rows)} rows into {table.name}...")
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.executemany(statement, [row_values(row) for row in rows])
+    finally:
+        cursor.close()
+    return len(rows)
+
+
 def bulk_merge_data(session: Session, data: List[Any]) -> int:
     """
     Merges a list of SQLModel objects into the database session.
@@ -126,7 +188,7 @@ def get_free_agents(session: Session) -> List[ProPlayers]:
     """
     Returns a list of all players who are not on a fantasy team.
     """
-    statement = select(ProPlayers).where(ProPlayers.fantasy_team_id is None)
+    statement = select(ProPlayers).where(ProPlayers.fantasy_team_id.is_(None))
     return list(session.exec(statement).all())
 
 
@@ -223,13 +285,13 @@ def find_player_interactive(
         # Search the database
         search_pattern = f"%{search_name}%"
         statement = select(ProPlayers).where(
-            func.lower(ProPlayers.player_name).like(search_pattern.lower())
+            ProPlayers.player_name.ilike(search_pattern)
         )
 
         # --- MODIFICATION ---
         # Add filter for free agents if requested
         if free_agents_only:
-            statement = statement.where(ProPlayers.fantasy_team_id is None)
+            statement = statement.where(ProPlayers.fantasy_team_id.is_(None))
 
         results = session.exec(statement).all()
 
@@ -4,8 +4,8 @@ General-purpose utility functions, like caching.
 (No changes were needed here)
 """
 
-import json
 import os
+import orjson
 from pathlib import Path
 
 
@@ -13,8 +13,11 @@ def save_data_to_cache(data: list | dict, cache_file: str):
     """Saves fetched data to a JSON cache file."""
     try:
         Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Schedule dicts are keyed by int game id; stored as strings like json.dump did
+        with open(cache_file, "wb") as f:
+            f.write(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
         print(f"  ✅ Cached data to {cache_file}")
     except Exception as e:
         print(f"  ! Error saving cache to {cache_file}: {e}")
@@ -24,9 +27,9 @@ def load_data_from_cache(cache_file: str) -> list | dict | None:
     """Loads data from a JSON cache file if it exists."""
     if os.path.exists(cache_file):
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
+            with open(cache_file, "rb") as f:
                 print(f"  ✅ Loading from cache: {cache_file}")
-                return json.load(f)
+                return orjson.loads(f.read())
         except Exception as e:
             print(f"  ! Error loading cache from {cache_file}: {e}")
             return None
@@ -3,7 +3,8 @@ utils/date_utils.py
 All date and time-related helper functions.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+import functools
 import pytz
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -24,10 +25,12 @@ def get_fantasy_week(date_str: str) -> tuple[int, int]:
     return (iso_calendar.year, iso_calendar.week)
 
 
+@functools.lru_cache(maxsize=None)
 def get_week_dates(year: int, week: int) -> tuple[str, str]:
     """
     Get the Monday (start) and Sunday (end) dates for a given ISO week.
     Returns tuple of (monday_date, sunday_date) as strings.
+    Cached, since callers ask for the same ~26 weeks once per team.
     """
     jan_4 = datetime(year, 1, 4)
     week_1_monday = jan_4 - timedelta(days=jan_4.weekday())
@@ -36,9 +39,17 @@ def get_week_dates(year: int, week: int) -> tuple[str, str]:
     return (target_monday.strftime("%Y-%m-%d"), target_sunday.strftime("%Y-%m-%d"))
 
 
+# Last (schedule_by_id, date index) pair. Keyed on the schedule dict itself:
+# get_schedule() hands every caller the same shared dict and builds a new one
+# on refresh, so an identity check is enough to tell versions apart.
+_schedule_by_date_memo: Optional[Tuple[Dict[str, dict], Dict[str, List[dict]]]] = None
+
+
 def get_schedule_by_date(schedule_by_id: Dict[str, dict]) -> Dict[str, List[dict]]:
     """
     Re-index the master schedule by fantasy date string.
+    Repeat calls with the same schedule dict return the same shared result,
+    so treat it as read-only.
 
     Args:
         schedule_by_id: Schedule dict keyed by game_id
@@ -46,6 +57,11 @@ def get_schedule_by_date(schedule_by_id: Dict[str, dict]) -> Dict[str, List[dict
     Returns:
         Dict mapping date strings (YYYY-MM-DD) to list of game dicts
     """
+    global _schedule_by_date_memo
+    memo = _schedule_by_date_memo
+    if memo is not None and memo[0] is schedule_by_id:
+        return memo[1]
+
     schedule_by_date = defaultdict(list)
     fantasy_tz = pytz.timezone(constants.FANTASY_TIMEZONE)
 
@@ -57,7 +73,14 @@ def get_schedule_by_date(schedule_by_id: Dict[str, dict]) -> Dict[str, List[dict
         schedule_by_date[date_key].append(
             {"game_id": game_id, "game_date_str": date_key, **game_data}
         )
-    return dict(schedule_by_date)
+    result = dict(schedule_by_date)
+    _schedule_by_date_memo = (schedule_by_id, result)
+    return result
+
+
+# Remaining-week matchups only change when the fantasy date does, so keep the
+# last result for the rest of the day: {(local_date, timezone): matchups}
+_remaining_matchups_cache: Dict[tuple, Dict[str, List[str]]] = {}
 
 
 async def calculate_remaining_week_matchups() -> Dict[str, List[str]]:
@@ -74,6 +97,10 @@ async def calculate_remaining_week_matchups() -> Dict[str, List[str]]:
     tz = pytz.timezone(constants.FANTASY_TIMEZONE)
     today = datetime.now(tz)
 
+    cache_key = (today.date(), constants.FANTASY_TIMEZONE)
+    if cache_key in _remaining_matchups_cache:
+        return _remaining_matchups_cache[cache_key]
+
     # 2. Find the end of the current week
     today_weekday_iso = today.isoweekday()  # 1=Mon, 7=Sun
     end_of_week = today + timedelta(days=7 - today_weekday_iso)
@@ -112,4 +139,7 @@ async def calculate_remaining_week_matchups() -> Dict[str, List[str]]:
         sorted_games = sorted(games, key=lambda x: x.split(" ")[-1])
         matchups[team] = sorted_games
 
+    # Only today's entry is ever useful, so drop older days
+    _remaining_matchups_cache.clear()
+    _remaining_matchups_cache[cache_key] = matchups
     return matchups
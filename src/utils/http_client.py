@@ -0,0 +1,68 @@
+"""
+utils/http_client.py
+One shared httpx.AsyncClient for all NHL API calls in a process.
+"""
+
+import asyncio
+from typing import Awaitable, Optional, TypeVar
+
+import httpx
+
+import src.core.constants as constants
+
+T = TypeVar("T")
+
+_client: Optional[httpx.AsyncClient] = None
+# The loop the client was created on; a client can't be reused across loops
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """
+    Creates the AsyncClient used for NHL API calls.
+    The pool is sized to CONCURRENCY_LIMIT so every in-flight request gets
+    its own kept-alive connection, and HTTP/2 lets requests to the same
+    host share connections instead of re-handshaking.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=constants.CONCURRENCY_LIMIT,
+            max_keepalive_connections=constants.CONCURRENCY_LIMIT,
+            keepalive_expiry=60,
+        ),
+        http2=True,
+        timeout=httpx.Timeout(constants.API_TIMEOUT, connect=5.0),
+    )
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Returns the shared client, creating it on first use (or if it was
+    closed, or belongs to a different event loop).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_client():
+    """Closes the shared client, if one is open."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+async def run_and_close_client(main: Awaitable[T]) -> T:
+    """
+    Awaits `main`, then closes the shared client.
+    Scripts use it as: asyncio.run(run_and_close_client(main()))
+    """
+    try:
+        return await main
+    finally:
+        await close_client()
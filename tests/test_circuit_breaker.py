@@ -0,0 +1,177 @@
+import asyncio
+import time
+
+import httpx
+import tenacity
+
+from src.api import helpers
+from src.api.helpers import CircuitBreaker, CircuitOpenError
+
+# Short enough to wait out in a test
+RESET_TIMEOUT = 0.05
+
+
+def trip(breaker: CircuitBreaker):
+    for _ in range(breaker.fail_max):
+        breaker.check()
+        breaker.record_failure()
+
+
+def assert_open(breaker: CircuitBreaker):
+    try:
+        breaker.check()
+    except CircuitOpenError:
+        return
+    raise AssertionError("expected the breaker to reject the call")
+
+
+# --- Tests ---
+
+
+def test_opens_after_fail_max_failures():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.check()  # Still closed at fail_max - 1
+    breaker.record_failure()
+    assert_open(breaker)
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.check()
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    trip(breaker)
+    time.sleep(RESET_TIMEOUT)
+
+    breaker.check()  # The probe
+    assert_open(breaker)  # Everyone else while the probe is out
+    assert_open(breaker)
+
+
+def test_probe_success_closes():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    trip(breaker)
+    time.sleep(RESET_TIMEOUT)
+
+    breaker.check()
+    breaker.record_success()
+    assert breaker.is_closed
+    breaker.check()
+    breaker.check()
+
+
+def test_probe_failure_reopens():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    trip(breaker)
+    time.sleep(RESET_TIMEOUT)
+
+    breaker.check()
+    breaker.record_failure()  # A single failure is enough when half-open
+    assert_open(breaker)
+
+    time.sleep(RESET_TIMEOUT)
+    breaker.check()  # Next probe after another full timeout
+    assert_open(breaker)
+
+
+def test_concurrent_requests_send_one_probe():
+    """After the reset timeout, concurrent get_with_retry calls reach the API once."""
+    sent = 0
+
+    async def handler(request):
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.02)
+        return httpx.Response(503)
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            results = await asyncio.gather(
+                *(helpers.get_with_retry(client, "http://test/") for _ in range(30)),
+                return_exceptions=True,
+            )
+        return results
+
+    original_breaker = helpers._api_breaker
+    original_wait = helpers.get_with_retry.retry.wait
+    helpers._api_breaker = CircuitBreaker(fail_max=3, reset_timeout=RESET_TIMEOUT)
+    helpers.get_with_retry.retry.wait = tenacity.wait_none()
+    try:
+        trip(helpers._api_breaker)
+        time.sleep(RESET_TIMEOUT)
+        results = asyncio.run(run())
+    finally:
+        helpers._api_breaker = original_breaker
+        helpers.get_with_retry.retry.wait = original_wait
+
+    assert sent == 1, f"expected a single probe request, got {sent}"
+    # The failed probe re-opens the breaker, so even its retry fails fast
+    assert all(isinstance(r, CircuitOpenError) for r in results)
+
+
+def test_fetch_helpers_raise_when_open():
+    """An open breaker surfaces from the fetch helpers instead of becoming None."""
+
+    async def handler(request):
+        return httpx.Response(200, json={})
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await asyncio.gather(
+                helpers.fetch_player_log(client, 1),
+                helpers.fetch_game_boxscore(client, 1),
+                return_exceptions=True,
+            )
+
+    original_breaker = helpers._api_breaker
+    helpers._api_breaker = CircuitBreaker(fail_max=3, reset_timeout=60)
+    try:
+        trip(helpers._api_breaker)
+        results = asyncio.run(run())
+    finally:
+        helpers._api_breaker = original_breaker
+
+    assert all(isinstance(r, CircuitOpenError) for r in results), results
+
+
+# --- Test Runner ---
+
+
+def run_tests():
+    """Runs every test in this file and prints a summary."""
+    print("Testing CircuitBreaker...")
+    tests = [
+        obj
+        for name, obj in list(globals().items())
+        if name.startswith("test_") and callable(obj)
+    ]
+
+    failed_count = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ PASS: {test.__name__}")
+        except AssertionError as e:
+            print(f"  ✗ FAIL: {test.__name__}: {e}")
+            failed_count += 1
+
+    print("\n--- Test Summary ---")
+    print(
+        f"Total: {len(tests)}, Passed: {len(tests) - failed_count}, Failed: {failed_count}"
+    )
+    if failed_count == 0:
+        print("All tests passed!")
+
+
+if __name__ == "__main__":
+    run_tests()
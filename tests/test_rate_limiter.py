@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from src.api.helpers import RateLimiter
+
+
+# --- Tests ---
+
+
+def test_burst_up_to_max_rate():
+    async def run():
+        limiter = RateLimiter(max_rate=5, time_period=1.0)
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.1
+
+
+def test_rate_below_one_does_not_deadlock():
+    """A bucket capped at max_rate < 1 could never hold a whole token."""
+
+    async def run():
+        limiter = RateLimiter(max_rate=0.5, time_period=0.05)
+        for _ in range(3):
+            await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_rejects_non_positive_rate():
+    try:
+        RateLimiter(max_rate=0)
+    except ValueError:
+        return
+    raise AssertionError("expected max_rate=0 to be rejected")
+
+
+# --- Test Runner ---
+
+
+def run_tests():
+    """Runs every test in this file and prints a summary."""
+    print("Testing RateLimiter...")
+    tests = [
+        obj
+        for name, obj in list(globals().items())
+        if name.startswith("test_") and callable(obj)
+    ]
+
+    failed_count = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ PASS: {test.__name__}")
+        except AssertionError as e:
+            print(f"  ✗ FAIL: {test.__name__}: {e}")
+            failed_count += 1
+
+    print("\n--- Test Summary ---")
+    print(
+        f"Total: {len(tests)}, Passed: {len(tests) - failed_count}, Failed: {failed_count}"
+    )
+    if failed_count == 0:
+        print("All tests passed!")
+
+
+if __name__ == "__main__":
+    run_tests()